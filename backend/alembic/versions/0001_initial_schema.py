@@ -0,0 +1,175 @@
+"""Initial schema
+
+Matches the tables previously created by Base.metadata.create_all at startup.
+Databases created that way should be marked as migrated with
+`alembic stamp 0001` before running `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+user_role = sa.Enum("ADMIN", "STAFF", "CLIENT", name="userrole")
+client_status = sa.Enum("LEAD", "ONBOARDING", "ACTIVE", "PAUSED", "CHURNED", name="clientstatus")
+project_type = sa.Enum(
+    "BOOKKEEPING", "COST_ACCOUNTING", "FINANCIAL_OS", "FINANCIAL_MODELLING", "LENDING",
+    "TAX_FILING", "CORPORATE_GROWTH", "ACQUISITIONS", "EXIT_PLANNING", "HNWI_INVESTMENTS",
+    "GLOBAL_STRUCTURING", "CFO_SERVICES", "OTHER",
+    name="projecttype",
+)
+project_status = sa.Enum(
+    "DRAFT", "PENDING", "IN_PROGRESS", "REVIEW", "COMPLETED", "CANCELLED",
+    name="projectstatus",
+)
+document_category = sa.Enum(
+    "TAX", "FINANCIAL", "LEGAL", "IDENTITY", "CONTRACT", "INVOICE", "RECEIPT", "REPORT", "OTHER",
+    name="documentcategory",
+)
+document_status = sa.Enum(
+    "UPLOADED", "PENDING_SIGNATURE", "SIGNED", "REJECTED", "ARCHIVED",
+    name="documentstatus",
+)
+task_status = sa.Enum("TODO", "IN_PROGRESS", "BLOCKED", "DONE", name="taskstatus")
+task_priority = sa.Enum("LOW", "MEDIUM", "HIGH", "URGENT", name="taskpriority")
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("first_name", sa.String(100), nullable=False),
+        sa.Column("last_name", sa.String(100), nullable=False),
+        sa.Column("role", user_role, nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("phone", sa.String(20), nullable=True),
+        *_timestamps(),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    
+    op.create_table(
+        "clients",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("company_name", sa.String(255), nullable=False),
+        sa.Column("abn", sa.String(11), nullable=True),
+        sa.Column("acn", sa.String(9), nullable=True),
+        sa.Column("industry", sa.String(100), nullable=True),
+        sa.Column("status", client_status, nullable=False),
+        sa.Column("assigned_manager_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("address_line1", sa.String(255), nullable=True),
+        sa.Column("address_line2", sa.String(255), nullable=True),
+        sa.Column("city", sa.String(100), nullable=True),
+        sa.Column("state", sa.String(50), nullable=True),
+        sa.Column("postcode", sa.String(10), nullable=True),
+        sa.Column("country", sa.String(100), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("health_score", sa.Integer(), nullable=True),
+        *_timestamps(),
+    )
+    op.create_index("ix_clients_id", "clients", ["id"])
+    
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("client_id", sa.Integer(), sa.ForeignKey("clients.id"), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("type", project_type, nullable=False),
+        sa.Column("status", project_status, nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column("due_date", sa.Date(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("estimated_hours", sa.Integer(), nullable=True),
+        sa.Column("actual_hours", sa.Integer(), nullable=True),
+        sa.Column("hourly_rate", sa.Integer(), nullable=True),
+        sa.Column("fixed_fee", sa.Integer(), nullable=True),
+        *_timestamps(),
+    )
+    op.create_index("ix_projects_id", "projects", ["id"])
+    
+    op.create_table(
+        "documents",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("uploaded_by_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("s3_key", sa.String(500), nullable=False),
+        sa.Column("mime_type", sa.String(100), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("sha256_hash", sa.String(64), nullable=True),
+        sa.Column("category", document_category, nullable=True),
+        sa.Column("status", document_status, nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("docusign_envelope_id", sa.String(100), nullable=True),
+        sa.Column("signed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("signed_s3_key", sa.String(500), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=True),
+        sa.Column("parent_document_id", sa.Integer(), sa.ForeignKey("documents.id"), nullable=True),
+        *_timestamps(),
+    )
+    op.create_index("ix_documents_id", "documents", ["id"])
+    
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", task_status, nullable=True),
+        sa.Column("priority", task_priority, nullable=True),
+        sa.Column("assignee_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("due_date", sa.Date(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("estimated_minutes", sa.Integer(), nullable=True),
+        sa.Column("actual_minutes", sa.Integer(), nullable=True),
+        *_timestamps(),
+    )
+    op.create_index("ix_tasks_id", "tasks", ["id"])
+    
+    op.create_table(
+        "messages",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=False),
+        sa.Column("sender_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("is_read", sa.Boolean(), nullable=True),
+        sa.Column("is_from_ai", sa.Boolean(), nullable=True),
+        sa.Column("attachment_document_id", sa.Integer(), sa.ForeignKey("documents.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_messages_id", "messages", ["id"])
+
+
+def downgrade() -> None:
+    for table in ("messages", "tasks", "documents", "projects", "clients", "users"):
+        op.drop_table(table)
+    
+    bind = op.get_bind()
+    for enum_type in (
+        task_priority, task_status, document_status, document_category,
+        project_status, project_type, client_status, user_role,
+    ):
+        enum_type.drop(bind, checkfirst=True)
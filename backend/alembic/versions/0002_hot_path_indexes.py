@@ -0,0 +1,51 @@
+"""Hot-path indexes for list endpoints and foreign keys
+
+Composite indexes follow the list query shapes: an optional equality filter
+followed by ORDER BY created_at DESC, id DESC. On PostgreSQL they are built
+CONCURRENTLY so existing tables stay writable.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CREATED_DESC = [sa.text("created_at DESC"), sa.text("id DESC")]
+
+INDEXES = [
+    ("ix_users_created_at_id", "users", CREATED_DESC),
+    ("ix_clients_user_id", "clients", ["user_id"]),
+    ("ix_clients_created_at_id", "clients", CREATED_DESC),
+    ("ix_clients_status_created_at_id", "clients", ["status", *CREATED_DESC]),
+    ("ix_projects_created_at_id", "projects", CREATED_DESC),
+    ("ix_projects_client_id_created_at_id", "projects", ["client_id", *CREATED_DESC]),
+    ("ix_projects_status_created_at_id", "projects", ["status", *CREATED_DESC]),
+    ("ix_documents_created_at_id", "documents", CREATED_DESC),
+    ("ix_documents_project_id_created_at_id", "documents", ["project_id", *CREATED_DESC]),
+    ("ix_tasks_project_id_created_at", "tasks", ["project_id", sa.text("created_at DESC")]),
+    ("ix_messages_project_id_created_at", "messages", ["project_id", sa.text("created_at DESC")]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,71 @@
+"""Content-addressed document storage
+
+Adds document_blobs (one row per stored S3 object, reference counted) and an
+index on documents.sha256_hash. Existing hashed documents are registered as
+blobs; documents without a hash keep their own object.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "document_blobs",
+        sa.Column("sha256_hash", sa.String(64), primary_key=True),
+        sa.Column("s3_key", sa.String(500), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    
+    # Before deduplication every upload had its own object: register one per
+    # hash and count the documents that point at that exact key
+    op.execute(
+        """
+        INSERT INTO document_blobs (sha256_hash, s3_key, size_bytes, ref_count)
+        SELECT sha256_hash, MIN(s3_key), MAX(size_bytes), 0
+        FROM documents
+        WHERE sha256_hash IS NOT NULL
+        GROUP BY sha256_hash
+        """
+    )
+    op.execute(
+        """
+        UPDATE document_blobs SET ref_count = (
+            SELECT COUNT(*) FROM documents
+            WHERE documents.s3_key = document_blobs.s3_key
+        )
+        """
+    )
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_documents_sha256_hash",
+            "documents",
+            ["sha256_hash"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_documents_sha256_hash",
+            table_name="documents",
+            postgresql_concurrently=True,
+        )
+    op.drop_table("document_blobs")
@@ -0,0 +1,30 @@
+"""Pending status for direct-to-S3 document uploads
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only PostgreSQL has a named enum type; elsewhere the column is plain text
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE documentstatus ADD VALUE IF NOT EXISTS 'PENDING_UPLOAD' BEFORE 'UPLOADED'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop an enum value; an unused extra value is harmless
+    pass
@@ -0,0 +1,37 @@
+"""Revocation table for stateless principal mode
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_revocations",
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("revoked_at", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_user_revocations_revoked_at", "user_revocations", ["revoked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_revocations_revoked_at", table_name="user_revocations")
+    op.drop_table("user_revocations")
@@ -0,0 +1,55 @@
+"""Paging indexes on the normalised timestamp for SQLite
+
+Keyset paging compares created_at through strftime() on SQLite, where
+timestamps are text in more than one format, so the plain column indexes
+from 0002 cannot serve it. On SQLite they are rebuilt on the same
+expression; PostgreSQL is unchanged.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SORT_TIME_DESC = [sa.text("strftime('%Y-%m-%d %H:%M:%f', created_at) DESC"), sa.text("id DESC")]
+CREATED_DESC = [sa.text("created_at DESC"), sa.text("id DESC")]
+
+# (name, table, leading columns) of the 0002 indexes that end in created_at, id
+INDEXES = [
+    ("ix_users_created_at_id", "users", []),
+    ("ix_clients_created_at_id", "clients", []),
+    ("ix_clients_status_created_at_id", "clients", ["status"]),
+    ("ix_projects_created_at_id", "projects", []),
+    ("ix_projects_client_id_created_at_id", "projects", ["client_id"]),
+    ("ix_projects_status_created_at_id", "projects", ["status"]),
+    ("ix_documents_created_at_id", "documents", []),
+    ("ix_documents_project_id_created_at_id", "documents", ["project_id"]),
+]
+
+
+def _rebuild(order) -> None:
+    for name, table, leading in INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, [*leading, *order])
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild(SORT_TIME_DESC)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild(CREATED_DESC)
@@ -0,0 +1,142 @@
+"""
+PATH: backend/app/api/bulk.py
+PURPOSE: Shared plumbing for bulk create/update endpoints
+ROLE IN ARCHITECTURE: Batch write path for clients, projects and tasks
+
+MAIN EXPORTS:
+    - check_batch_size: Reject empty or oversized batches
+    - existing_ids: Which of a set of ids exist, in one query
+    - bulk_insert: Multi-row INSERT ... RETURNING id for the valid items
+    - bulk_update: Executemany UPDATE by primary key for the valid items
+
+NOTES FOR FUTURE AI:
+    - Endpoints validate references up front (one IN query per referenced
+      table) and pass per-item errors in; rejected items are skipped and
+      reported, the rest are written in a single statement
+    - Schema (422) errors still reject the whole request
+    - A database error during the write fails the whole batch
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.schemas.bulk import BulkItemResult, BulkResponse
+
+
+def check_batch_size(items: Sequence[Any]) -> None:
+    """
+    Raises:
+        HTTPException 400: Batch is empty or larger than BULK_MAX_ITEMS
+    """
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch is empty",
+        )
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch exceeds {settings.BULK_MAX_ITEMS} items",
+        )
+
+
+async def existing_ids(db: AsyncSession, column: Any, ids: Iterable[Optional[int]]) -> Set[int]:
+    """Return the subset of `ids` present in `column`."""
+    wanted = {i for i in ids if i is not None}
+    if not wanted:
+        return set()
+    result = await db.execute(select(column).where(column.in_(wanted)))
+    return set(result.scalars().all())
+
+
+def _response(results: List[BulkItemResult]) -> BulkResponse:
+    failed = sum(1 for r in results if r.error is not None)
+    return BulkResponse(
+        succeeded=len(results) - failed,
+        failed=failed,
+        results=results,
+    )
+
+
+async def bulk_insert(
+    db: AsyncSession,
+    model: Any,
+    rows: Sequence[Dict[str, Any]],
+    errors: Dict[int, str],
+) -> BulkResponse:
+    """
+    Insert every row whose index is not in `errors`.
+
+    Args:
+        db: Session to execute on
+        model: Mapped class to insert into
+        rows: Column values per item, all with the same keys
+        errors: Item index -> reason it was rejected
+
+    Returns:
+        Per-item results carrying the new id or the error
+    """
+    accepted = [i for i in range(len(rows)) if i not in errors]
+    new_ids: List[int] = []
+
+    if accepted:
+        result = await db.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            [rows[i] for i in accepted],
+        )
+        new_ids = list(result.scalars().all())
+
+    created = dict(zip(accepted, new_ids))
+    return _response([
+        BulkItemResult(index=i, id=created.get(i), error=errors.get(i))
+        for i in range(len(rows))
+    ])
+
+
+async def bulk_update(
+    db: AsyncSession,
+    model: Any,
+    rows: Sequence[Dict[str, Any]],
+    errors: Dict[int, str],
+    not_found: str,
+) -> BulkResponse:
+    """
+    Update every row whose index is not in `errors`.
+
+    Args:
+        db: Session to execute on
+        model: Mapped class with an `id` primary key
+        rows: Changed columns per item, each including "id"
+        errors: Item index -> reason it was rejected
+        not_found: Error reported for ids that do not exist
+
+    Returns:
+        Per-item results carrying the id or the error
+    """
+    errors = dict(errors)
+    found = await existing_ids(db, model.id, (row["id"] for row in rows))
+
+    for i, row in enumerate(rows):
+        if i not in errors and row["id"] not in found:
+            errors[i] = not_found
+
+    # Items with no changed columns are reported as succeeded without a write
+    accepted = [rows[i] for i in range(len(rows)) if i not in errors and len(rows[i]) > 1]
+    if accepted:
+        await db.execute(
+            update(model).execution_options(synchronize_session=False),
+            accepted,
+        )
+
+    return _response([
+        BulkItemResult(
+            index=i,
+            id=None if i in errors else row["id"],
+            error=errors.get(i),
+        )
+        for i, row in enumerate(rows)
+    ])
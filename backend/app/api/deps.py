@@ -4,30 +4,77 @@ PURPOSE: Dependency injection for API routes
 ROLE IN ARCHITECTURE: Common dependencies shared across endpoints
 
 MAIN EXPORTS:
-    - get_current_user: Extract and validate current user from token
+    - get_current_user: Extract and validate current user from token (cached)
+    - get_current_principal: Lightweight identity, from claims in stateless mode
     - require_staff: Require staff or admin role
     - require_admin: Require admin role
+    - Principal: Identity and role of the caller
+    - RateLimit: Sliding-window rate limit dependency
+    - enforce_rate_limit: Rate limit an arbitrary key from inside a handler
+    - cache_scope: Response cache scope for the caller
+    - client_ip: Caller's address, honouring X-Forwarded-For from trusted proxies
+
+NOTES FOR FUTURE AI:
+    - Use get_current_user when the handler needs the User row. It is
+      detached (loaded on its own primary read session, or from cache), so
+      write handlers must update users through their own session
+    - require_staff/require_admin return a Principal; with
+      STATELESS_PRINCIPAL_ENABLED they never query the users table
+    - RateLimit keys by client_ip. Behind nginx the peer is the proxy, so its
+      address must be listed in TRUSTED_PROXIES or every caller shares one key
 """
 
-from fastapi import Depends, HTTPException, status
+import ipaddress
+import math
+from dataclasses import dataclass
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.database import get_db
-from app.core.security import verify_token
+from app.core.config import settings
+from app.core.database import primary_read_session
+from app.core.principal_cache import principal_cache
+from app.core.rate_limit import rate_limiter
+from app.core.revocation import revocations
+from app.core.security import token_subject, verify_token
 from app.models.user import User, UserRole
 
 security = HTTPBearer()
 
+_trusted_proxies = [
+    ipaddress.ip_network(network.strip(), strict=False)
+    for network in settings.TRUSTED_PROXIES.split(",")
+    if network.strip()
+]
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller identity used for role checks."""
+    id: int
+    role: UserRole
+
+
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
 ) -> User:
     """
     Validate JWT token and return current user.
     
+    The user row is served from the principal cache when possible, so
+    most requests do not SELECT from users. Misses read the primary in
+    AUTOCOMMIT (never a replica, which could still show a deactivated user
+    as active), so GET requests never BEGIN/COMMIT for authentication.
+    
     Raises:
         HTTPException 401: Invalid or expired token
         HTTPException 404: User not found
@@ -36,21 +83,23 @@ async def get_current_user(
     payload = verify_token(token, token_type="access")
     
     if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_token()
     
     user_id = int(payload["sub"])
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await principal_cache.get(user_id)
     
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+    if user is None:
+        async with primary_read_session() as db:
+            result = await db.execute(select(User).where(User.id == user_id))
+            user = result.scalar_one_or_none()
+        
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        
+        await principal_cache.set(user)
     
     if not user.is_active:
         raise HTTPException(
@@ -61,26 +110,155 @@ async def get_current_user(
     return user
 
 
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> Principal:
+    """
+    Return the caller's id and role.
+    
+    In stateless principal mode these come from the token's claims, and
+    tokens issued before the user was revoked (deactivated or role changed)
+    are rejected. Otherwise the user row is loaded via get_current_user.
+    
+    Raises:
+        HTTPException 401: Invalid, expired or revoked token
+    """
+    if not settings.STATELESS_PRINCIPAL_ENABLED:
+        user = await get_current_user(credentials)
+        return Principal(id=user.id, role=user.role)
+    
+    payload = verify_token(credentials.credentials, token_type="access")
+    if not payload or "role" not in payload or "iat" not in payload:
+        raise _invalid_token()
+    
+    user_id = int(payload["sub"])
+    if await revocations.is_revoked(user_id, payload["iat"]):
+        raise _invalid_token()
+    
+    return Principal(id=user_id, role=UserRole(payload["role"]))
+
+
+def cache_scope(user) -> str:
+    """
+    Response cache scope: staff and admins share one view of the data,
+    client users each get their own.
+    
+    Args:
+        user: User or Principal
+    """
+    if user.role == UserRole.CLIENT:
+        return f"user:{user.id}"
+    return "staff"
+
+
 async def require_staff(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
     """Require user to be staff or admin."""
-    if current_user.role not in [UserRole.STAFF, UserRole.ADMIN]:
+    if principal.role not in [UserRole.STAFF, UserRole.ADMIN]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Staff access required",
         )
-    return current_user
+    return principal
 
 
 async def require_admin(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
     """Require user to be admin."""
-    if current_user.role != UserRole.ADMIN:
+    if principal.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
         )
-    return current_user
+    return principal
 
+
+async def enforce_rate_limit(key: str, limit: int, window_seconds: int) -> None:
+    """
+    Count an attempt against `key`.
+    
+    Raises:
+        HTTPException 429: Budget for this window is exhausted
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    
+    retry_after = await rate_limiter.hit(key, limit, window_seconds)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+class RateLimit:
+    """
+    Dependency enforcing a sliding-window budget per client.
+    
+    Usage:
+        @router.post("/chat", dependencies=[Depends(RateLimit("ai-chat", 30, 60, per="user"))])
+    
+    Args:
+        scope: Name of the budget, shared by every route using it
+        limit: Maximum requests per window
+        window_seconds: Window length
+        per: "ip" to key by client address, "user" to key by token subject
+            (falls back to IP when the request has no valid token)
+    """
+    
+    def __init__(self, scope: str, limit: int, window_seconds: int, per: str = "ip"):
+        self.scope = scope
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.per = per
+    
+    async def __call__(self, request: Request) -> None:
+        await enforce_rate_limit(
+            f"{self.scope}:{self._client_key(request)}",
+            self.limit,
+            self.window_seconds,
+        )
+    
+    def _client_key(self, request: Request) -> str:
+        if self.per == "user":
+            subject = token_subject(request.headers.get("Authorization"))
+            if subject is not None:
+                return f"user:{subject}"
+        
+        return f"ip:{client_ip(request)}"
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _trusted_proxies)
+
+
+def client_ip(request: Request) -> str:
+    """
+    Address of the caller.
+    
+    When the direct peer is a trusted proxy, the rightmost X-Forwarded-For
+    hop that is not itself a trusted proxy is used (falling back to
+    X-Real-IP); headers from untrusted peers are ignored, so they cannot be
+    spoofed to dodge rate limits.
+    """
+    peer = request.client.host if request.client else None
+    if peer is None:
+        return "unknown"
+    if not _is_trusted_proxy(peer):
+        return peer
+    
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        for hop in reversed([hop.strip() for hop in forwarded.split(",")]):
+            if hop and not _is_trusted_proxy(hop):
+                return hop
+    
+    real_ip = request.headers.get("x-real-ip")
+    return real_ip.strip() if real_ip else peer
@@ -0,0 +1,102 @@
+"""
+PATH: backend/app/api/etags.py
+PURPOSE: Weak ETags and conditional GET (If-None-Match -> 304)
+ROLE IN ARCHITECTURE: Makes portal polling of unchanged resources nearly free
+
+MAIN EXPORTS:
+    - row_etag: Weak ETag for one row from (id, updated_at)
+    - page_etag: Weak ETag for a list page from its rows and next cursor
+    - if_none_match: Whether a request's If-None-Match matches an ETag
+    - not_modified: Empty 304 response carrying the ETag
+    - check_row_not_modified: Cheap version SELECT answering 304 before loading a row
+
+NOTES FOR FUTURE AI:
+    - Rows that were never updated have updated_at NULL; created_at stands in
+    - Every write path must bump updated_at (the models' onupdate does this
+      for ORM and Core UPDATEs), or clients will keep a stale copy. It is set
+      with now_precise, so two writes in the same second differ
+    - Build ETags from a fresh read of the row, never from the cached
+      principal, which can lag behind a write
+    - ETags are weak: they identify the row version, not the exact bytes
+"""
+
+import hashlib
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.pagination import NEXT_CURSOR_HEADER
+
+
+def _version(updated_at: Any, created_at: Any) -> str:
+    stamp = updated_at or created_at
+    return stamp.isoformat() if stamp is not None else ""
+
+
+def _weak(parts: Iterable[str]) -> str:
+    digest = hashlib.sha1("|".join(parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def row_etag(kind: str, row_id: int, updated_at: Any, created_at: Any) -> str:
+    """Weak ETag for one row of `kind` (e.g. "client")."""
+    return _weak([kind, str(row_id), _version(updated_at, created_at)])
+
+
+def page_etag(kind: str, rows: Iterable[Any], response: Response) -> str:
+    """Weak ETag for a list page: its rows' versions plus the next cursor."""
+    parts = [kind, response.headers.get(NEXT_CURSOR_HEADER, "")]
+    parts.extend(f"{row.id}@{_version(row.updated_at, row.created_at)}" for row in rows)
+    return _weak(parts)
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match header matches `etag` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    candidates = [tag.strip() for tag in header.split(",")]
+    if "*" in candidates:
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching conditional GET."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+async def check_row_not_modified(
+    db: AsyncSession,
+    request: Request,
+    kind: str,
+    version_query: Select,
+) -> Optional[Response]:
+    """
+    Answer a conditional GET from the row's version columns alone.
+
+    Args:
+        db: Session to query
+        request: Incoming request
+        kind: Resource kind used in the ETag
+        version_query: Select of (id, updated_at, created_at) for the row,
+            including any access filter; no row means "load normally"
+
+    Returns:
+        A 304 response if the client's copy is current, else None
+    """
+    if not request.headers.get("if-none-match"):
+        return None
+
+    result = await db.execute(version_query)
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    etag = row_etag(kind, *row)
+    return not_modified(etag) if if_none_match(request, etag) else None
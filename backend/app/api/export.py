@@ -0,0 +1,213 @@
+"""
+PATH: backend/app/api/export.py
+PURPOSE: Streaming CSV / NDJSON / Parquet exports
+ROLE IN ARCHITECTURE: Bulk extraction path for list endpoints (BI, backups)
+
+MAIN EXPORTS:
+    - ExportParams: Dependency reading format and column selection
+    - stream_export: Build a StreamingResponse over a server-side cursor
+
+NOTES FOR FUTURE AI:
+    - Rows are fetched EXPORT_BATCH_SIZE at a time with yield_per, so memory
+      stays flat regardless of table size
+    - The export opens its own session: dependency sessions are closed
+      before a StreamingResponse body runs
+    - Exportable columns are those of the resource's response schema
+      (app.api.fields.schema_columns), so an export never exposes more than
+      the JSON API
+    - Parquet needs pyarrow, which is optional
+"""
+
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Sequence
+
+from fastapi import HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy import types as sqltypes
+
+from app.core.config import settings
+from app.core.database import open_stream_session
+
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class ExportParams:
+    """
+    Export query parameters.
+
+    Args:
+        format: csv, ndjson or parquet
+        columns: Comma-separated column names (default: all exportable)
+    """
+
+    def __init__(
+        self,
+        format: str = Query("csv", pattern="^(csv|ndjson|parquet)$"),
+        columns: Optional[str] = Query(None, description="Comma-separated columns"),
+    ):
+        self.format = format
+        self.columns = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _csv_encoder(names: List[str]) -> Callable[[Iterable[Sequence[Any]], bool], bytes]:
+    def encode(rows: Iterable[Sequence[Any]], first: bool) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if first:
+            writer.writerow(names)
+        writer.writerows([_plain(v) for v in row] for row in rows)
+        return buffer.getvalue().encode()
+    return encode
+
+
+def _ndjson_encoder(names: List[str]) -> Callable[[Iterable[Sequence[Any]], bool], bytes]:
+    def encode(rows: Iterable[Sequence[Any]], first: bool) -> bytes:
+        lines = [json.dumps(dict(zip(names, map(_plain, row)))) for row in rows]
+        return ("\n".join(lines) + "\n").encode() if lines else b""
+    return encode
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that keeps only the bytes not yet sent."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class _ParquetStream:
+    """Parquet writer that hands back bytes after each row group."""
+
+    def __init__(self, names: List[str], columns: Sequence[Any]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Parquet export is not available",
+            )
+
+        self.pa = pa
+        self.names = names
+        self.schema = pa.schema([
+            (name, self._arrow_type(column.type)) for name, column in zip(names, columns)
+        ])
+        self.sink = _ChunkSink()
+        self.writer = pq.ParquetWriter(self.sink, self.schema)
+
+    def _arrow_type(self, column_type: Any) -> Any:
+        pa = self.pa
+        if isinstance(column_type, sqltypes.Boolean):
+            return pa.bool_()
+        if isinstance(column_type, sqltypes.Integer):
+            return pa.int64()
+        if isinstance(column_type, sqltypes.Float):
+            return pa.float64()
+        if isinstance(column_type, sqltypes.DateTime):
+            return pa.timestamp("us", tz="UTC" if column_type.timezone else None)
+        if isinstance(column_type, sqltypes.Date):
+            return pa.date32()
+        return pa.string()
+
+    def encode(self, rows: Iterable[Sequence[Any]], first: bool) -> bytes:
+        records = [
+            {
+                name: value.value if isinstance(value, enum.Enum) else value
+                for name, value in zip(self.names, row)
+            }
+            for row in rows
+        ]
+        self.writer.write_table(self.pa.Table.from_pylist(records, schema=self.schema))
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        self.writer.close()
+        return self.sink.drain()
+
+
+def stream_export(
+    query: Select,
+    columns: List[Any],
+    params: ExportParams,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Stream the rows of `query` restricted to `columns`.
+
+    Args:
+        query: Filtered and scoped select of the model (ordering is kept)
+        columns: Columns from app.api.fields.schema_columns
+        params: Export parameters
+        filename: Download name without extension
+    """
+    names = [column.name for column in columns]
+    stmt = query.with_only_columns(*columns).execution_options(
+        yield_per=settings.EXPORT_BATCH_SIZE,
+    )
+
+    parquet = _ParquetStream(names, columns) if params.format == "parquet" else None
+    if parquet:
+        encode = parquet.encode
+    elif params.format == "ndjson":
+        encode = _ndjson_encoder(names)
+    else:
+        encode = _csv_encoder(names)
+
+    async def body() -> AsyncIterator[bytes]:
+        db = open_stream_session()
+        try:
+            result = await db.stream(stmt)
+            first = True
+            async for rows in result.partitions():
+                yield encode(rows, first)
+                first = False
+            if first and params.format == "csv":
+                yield encode([], True)
+            if parquet:
+                yield parquet.close()
+        finally:
+            await db.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[params.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{params.format}"',
+        },
+    )
@@ -0,0 +1,118 @@
+"""
+PATH: backend/app/api/fields.py
+PURPOSE: Sparse fieldsets (?fields=) for list endpoints
+ROLE IN ARCHITECTURE: Column projection shared by list and export endpoints
+
+MAIN EXPORTS:
+    - FieldSelection: Dependency reading the ?fields= parameter
+    - schema_columns: Resolve field names to model columns
+    - fetch_sparse_page: Paged Core select of chosen columns returned as dicts
+
+NOTES FOR FUTURE AI:
+    - Selectable fields are those of the resource's response schema
+    - Sparse pages bypass ORM objects and response_model validation; rows
+      go straight from the cursor to JSON
+    - Without ?fields= handlers load ORM rows and serialize them with
+      app.api.responses.list_response
+"""
+
+from typing import Any, List, Optional, Type
+
+from fastapi import HTTPException, Query, Response, status
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.pagination import NEXT_CURSOR_HEADER, PageParams, encode_cursor
+from app.api.responses import FastJSONResponse
+
+
+def schema_columns(model: Any, schema: Type[BaseModel], requested: Optional[List[str]]) -> List[Any]:
+    """
+    Resolve field names to model columns, limited to the response schema.
+
+    Args:
+        model: Mapped class
+        schema: Response schema defining which fields are exposed
+        requested: Field names, or None for all exposed fields
+
+    Raises:
+        HTTPException 400: Unknown or non-exposed field
+    """
+    table = model.__table__.columns
+    allowed = [name for name in schema.model_fields if name in table]
+
+    if not requested:
+        return [table[name] for name in allowed]
+
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return [table[name] for name in requested]
+
+
+class FieldSelection:
+    """
+    The ?fields= query parameter.
+
+    Args:
+        fields: Comma-separated field names (default: all fields)
+    """
+
+    def __init__(
+        self,
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    ):
+        self.names = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+    def __bool__(self) -> bool:
+        return bool(self.names)
+
+
+async def fetch_sparse_page(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    schema: Type[BaseModel],
+    fields: FieldSelection,
+    page: PageParams,
+    response: Response,
+) -> FastJSONResponse:
+    """
+    Execute a paged list query selecting only the requested fields.
+
+    Args:
+        db: Session to run the query on
+        query: Filtered select of `model` (no ordering or limit)
+        model: Model with created_at and id columns
+        schema: Response schema bounding the selectable fields
+        fields: Requested fields
+        page: Paging parameters
+        response: Injected response whose headers are carried over
+
+    Returns:
+        JSON array of objects with exactly the requested fields
+    """
+    columns = schema_columns(model, schema, fields.names)
+    names = [column.name for column in columns]
+
+    # The cursor needs the sort key even when it is not requested
+    table = model.__table__.columns
+    extra = [table[name] for name in ("created_at", "id") if name not in names]
+
+    stmt = page.apply(query, model).with_only_columns(*columns, *extra)
+    result = await db.execute(stmt)
+    rows = result.mappings().all()
+    has_more = len(rows) > page.limit
+    rows = rows[:page.limit]
+
+    if has_more and rows:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last["created_at"], last["id"])
+
+    sparse = FastJSONResponse(content=[{name: row[name] for name in names} for row in rows])
+    sparse.raw_headers.extend(response.raw_headers)
+    return sparse
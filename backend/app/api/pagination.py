@@ -0,0 +1,134 @@
+"""
+PATH: backend/app/api/pagination.py
+PURPOSE: Keyset (cursor) pagination for list endpoints
+ROLE IN ARCHITECTURE: Shared paging for list_* handlers
+
+MAIN EXPORTS:
+    - PageParams: Dependency reading skip/limit/cursor query parameters
+    - fetch_page: Run a list query and set the next-page cursor header
+    - NEXT_CURSOR_HEADER: Response header carrying the next cursor
+
+NOTES FOR FUTURE AI:
+    - Lists are ordered by (created_at DESC, id DESC); the matching indexes
+      are in migration 0002
+    - The body stays a plain JSON array for backward compatibility; the
+      cursor for the next page is returned in the X-Next-Cursor header
+    - `skip` still works but degrades on deep pages; prefer `cursor`
+    - SQLite stores datetimes as text in more than one format (server
+      defaults have no fraction), so there both the ordering and the cursor
+      comparison go through sort_time, which normalises them; the paging
+      indexes are declared on the same expression
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import Select, bindparam, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import sort_time
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a row position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        ValueError: Cursor is malformed
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    return datetime.fromisoformat(created_at), int(row_id)
+
+
+class PageParams:
+    """
+    Paging query parameters shared by list endpoints.
+    
+    Args:
+        skip: Offset for legacy paging (ignored when cursor is given)
+        limit: Page size
+        cursor: Opaque cursor from a previous page's X-Next-Cursor header
+    """
+    
+    def __init__(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+    ):
+        self.skip = skip
+        self.limit = limit
+        self.after: Optional[Tuple[datetime, int]] = None
+        
+        if cursor:
+            try:
+                self.after = decode_cursor(cursor)
+            except (ValueError, TypeError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor",
+                )
+    
+    def apply(self, query: Select, model: Any) -> Select:
+        """Add ordering, the keyset or offset condition, and a one-row lookahead."""
+        created_at = sort_time(model.created_at)
+        query = query.order_by(created_at.desc(), model.id.desc())
+        
+        if self.after is not None:
+            after_created_at, after_id = self.after
+            after = sort_time(bindparam(None, after_created_at, type_=model.created_at.type))
+            query = query.where(
+                # Implied by the row comparison, but SQLite only seeks the
+                # index on a plain bound
+                created_at <= after,
+                tuple_(created_at, model.id) < tuple_(after, after_id),
+            )
+        elif self.skip:
+            query = query.offset(self.skip)
+        
+        return query.limit(self.limit + 1)
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    page: PageParams,
+    response: Response,
+) -> List[Any]:
+    """
+    Execute a paged list query.
+    
+    Args:
+        db: Session to run the query on
+        query: Filtered select of `model` (no ordering or limit)
+        model: Model with created_at and id columns
+        page: Paging parameters
+        response: Response to set the X-Next-Cursor header on
+    
+    Returns:
+        Up to page.limit rows
+    """
+    result = await db.execute(page.apply(query, model))
+    rows = list(result.scalars().all())
+    has_more = len(rows) > page.limit
+    rows = rows[:page.limit]
+    
+    if has_more and rows:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    
+    return rows
@@ -0,0 +1,65 @@
+"""
+PATH: backend/app/api/ranges.py
+PURPOSE: HTTP Range request parsing (RFC 9110 byte ranges)
+ROLE IN ARCHITECTURE: Partial responses for the document content proxy
+
+MAIN EXPORTS:
+    - parse_range: Resolve a Range header to an inclusive (first, last) byte pair
+
+NOTES FOR FUTURE AI:
+    - Only single ranges are served; multi-range and malformed headers get
+      the full 200 response, which RFC 9110 allows
+"""
+
+import re
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+
+
+_SINGLE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Resolve a Range header against a resource of `size` bytes.
+
+    Args:
+        header: Raw Range header value, if any
+        size: Resource length in bytes
+
+    Returns:
+        Inclusive (first, last) byte positions, or None to send everything
+
+    Raises:
+        HTTPException 416: The range starts beyond the end of the resource
+    """
+    if not header or size <= 0:
+        return None
+
+    match = _SINGLE_RANGE.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0:
+            _unsatisfiable(size)
+        return max(size - length, 0), size - 1
+
+    first = int(first)
+    if last and int(last) < first:
+        return None
+    if first >= size:
+        _unsatisfiable(size)
+    return first, min(int(last), size - 1) if last else size - 1
+
+
+def _unsatisfiable(size: int) -> None:
+    raise HTTPException(
+        status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+        detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{size}"},
+    )
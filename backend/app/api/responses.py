@@ -0,0 +1,69 @@
+"""
+PATH: backend/app/api/responses.py
+PURPOSE: Fast JSON serialization for API responses
+ROLE IN ARCHITECTURE: Default response class of api_router and list fast path
+
+MAIN EXPORTS:
+    - FastJSONResponse: JSONResponse rendered by pydantic-core
+    - list_response: Serialize ORM rows through a cached TypeAdapter (with page ETag)
+
+NOTES FOR FUTURE AI:
+    - pydantic-core's to_json handles datetimes, enums, decimals and models
+      natively, so content needs no jsonable_encoder pass
+    - list_response validates and dumps in Rust and returns the bytes
+      directly; FastAPI skips its own response_model pass for Response
+      objects, so the handler's response_model is still the documented
+      shape but is not applied twice
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Type
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from app.api.etags import if_none_match, not_modified, page_etag
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with pydantic-core instead of stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Compiled adapter for List[schema], built once per schema."""
+    return TypeAdapter(List[schema])
+
+
+def list_response(
+    rows: Sequence[Any],
+    schema: Type[BaseModel],
+    response: Response,
+    request: Optional[Request] = None,
+) -> Response:
+    """
+    Serialize ORM rows as a JSON array of `schema`.
+
+    Args:
+        rows: Objects to serialize
+        schema: Response schema for each row
+        response: Injected response whose headers (e.g. X-Next-Cursor) are kept
+        request: When given, a matching If-None-Match is answered with 304
+            before serializing (omit it inside response cache builds)
+    """
+    etag = page_etag(schema.__name__, rows, response)
+    if request is not None and if_none_match(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    adapter = list_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    fast = Response(content=body, media_type="application/json")
+    fast.raw_headers.extend(response.raw_headers)
+    return fast
@@ -0,0 +1,72 @@
+"""
+PATH: backend/app/api/scoping.py
+PURPOSE: Row visibility rules for client users
+ROLE IN ARCHITECTURE: Shared tenant scoping for project and document queries
+
+MAIN EXPORTS:
+    - client_scope: SQL expression for the caller's client id
+    - scope_projects: Restrict a Project query to rows the caller may see
+    - scope_documents: Restrict a Document query to rows the caller may see
+    - project_visible: Boolean SQL expression for project visibility
+    - remember_client_id: Cache a user's client id once it is known
+
+NOTES FOR FUTURE AI:
+    - Scoping is expressed inside the query (subquery or literal), so a
+      scoped read is a single statement
+    - Staff and admins see everything; only CLIENT users are restricted
+    - A user's client id is cached once known; Client.user_id never changes
+"""
+
+from typing import Any
+
+from sqlalchemy import Select, select, true
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.cache import TTLCache
+from app.models.client import Client
+from app.models.document import Document
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+_client_ids = TTLCache(max_size=100000, ttl_seconds=3600)
+
+
+def remember_client_id(user_id: int, client_id: int) -> None:
+    """Cache the client profile id belonging to a user."""
+    _client_ids.set(user_id, client_id)
+
+
+def client_scope(user_id: int) -> Any:
+    """
+    Return the user's client id as a SQL value.
+    
+    A cached id is used as a literal; otherwise a scalar subquery resolves
+    it inside the same statement (NULL when the user has no client profile).
+    """
+    client_id = _client_ids.get(user_id)
+    if client_id is not None:
+        return client_id
+    return select(Client.id).where(Client.user_id == user_id).scalar_subquery()
+
+
+def project_visible(user: User) -> ColumnElement:
+    """Boolean expression that is true for projects the user may see."""
+    if user.role != UserRole.CLIENT:
+        return true()
+    return Project.client_id == client_scope(user.id)
+
+
+def scope_projects(query: Select, user: User) -> Select:
+    """Restrict a query over Project to the user's visible projects."""
+    if user.role != UserRole.CLIENT:
+        return query
+    return query.where(Project.client_id == client_scope(user.id))
+
+
+def scope_documents(query: Select, user: User) -> Select:
+    """Restrict a query over Document to documents in the user's visible projects."""
+    if user.role != UserRole.CLIENT:
+        return query
+    visible_projects = select(Project.id).where(Project.client_id == client_scope(user.id))
+    return query.where(Document.project_id.in_(visible_projects))
@@ -8,8 +8,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, RateLimit
 from app.models.user import User
 from app.services.ai import AIService
 
@@ -49,7 +50,13 @@ class DocumentAnalysisResponse(BaseModel):
     category_suggestion: Optional[str] = None
 
 
-@router.post("/chat", response_model=ChatResponse)
+@router.post(
+    "/chat",
+    response_model=ChatResponse,
+    dependencies=[
+        Depends(RateLimit("ai-chat", settings.AI_CHAT_RATE_LIMIT_PER_USER, 60, per="user")),
+    ],
+)
 async def chat_with_assistant(
     request: ChatRequest,
     db: AsyncSession = Depends(get_db),
@@ -12,12 +12,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.database import get_db
+from app.api.deps import RateLimit, enforce_rate_limit
+from app.api.writes import insert_returning
 from app.core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password_async,
     create_access_token,
     create_refresh_token,
     verify_token,
+    PasswordHashingBusy,
 )
 from app.core.config import settings
 from app.models.user import User
@@ -26,7 +29,27 @@ from app.schemas.user import UserCreate, UserLogin, TokenResponse, UserResponse
 router = APIRouter()
 
 
-@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+def _hashing_busy() -> HTTPException:
+    """503 returned when the password hashing pool is saturated."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
+@router.post(
+    "/register",
+    response_model=TokenResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[
+        Depends(RateLimit(
+            "register",
+            settings.REGISTER_RATE_LIMIT_PER_IP,
+            settings.REGISTER_RATE_LIMIT_WINDOW_SECONDS,
+        )),
+    ],
+)
 async def register(
     user_in: UserCreate,
     db: AsyncSession = Depends(get_db),
@@ -36,27 +59,31 @@ async def register(
     
     Creates a new user account and returns authentication tokens.
     """
-    # Check if email exists
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    if result.scalar_one_or_none():
+    try:
+        password_hash = await hash_password_async(user_in.password)
+    except PasswordHashingBusy:
+        raise _hashing_busy()
+    
+    # The unique email constraint decides duplicates in the same statement
+    user = await insert_returning(
+        db,
+        User,
+        {
+            "email": user_in.email,
+            "password_hash": password_hash,
+            "first_name": user_in.first_name,
+            "last_name": user_in.last_name,
+            "phone": user_in.phone,
+            "role": user_in.role,
+        },
+        on_conflict_do_nothing=["email"],
+    )
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
     
-    # Create user
-    user = User(
-        email=user_in.email,
-        password_hash=hash_password(user_in.password),
-        first_name=user_in.first_name,
-        last_name=user_in.last_name,
-        phone=user_in.phone,
-        role=user_in.role,
-    )
-    db.add(user)
-    await db.flush()
-    await db.refresh(user)
-    
     # Generate tokens
     access_token = create_access_token(
         subject=user.id,
@@ -72,23 +99,59 @@ async def register(
     )
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[
+        Depends(RateLimit(
+            "login",
+            settings.LOGIN_RATE_LIMIT_PER_IP,
+            settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+        )),
+    ],
+)
 async def login(
     credentials: UserLogin,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Authenticate user and return tokens.
+    
+    Attempts are rate limited per IP and per email before any password
+    verification happens.
     """
+    await enforce_rate_limit(
+        f"login:email:{credentials.email.lower()}",
+        settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+        settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+    )
+    
     result = await db.execute(select(User).where(User.email == credentials.email))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password",
+        )
+    
+    try:
+        valid, new_hash = await verify_and_update_password_async(
+            credentials.password, user.password_hash
+        )
+    except PasswordHashingBusy:
+        raise _hashing_busy()
+    
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
     
+    # Transparently upgrade hashes made with an older cost factor
+    if new_hash:
+        user.password_hash = new_hash
+    
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
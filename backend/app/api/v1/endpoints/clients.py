@@ -3,38 +3,83 @@ PATH: backend/app/api/v1/endpoints/clients.py
 PURPOSE: Client management endpoints
 """
 
+import os
+import tempfile
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import (
+    APIRouter, BackgroundTasks, Depends, File, HTTPException, status, Query, Request, Response,
+    UploadFile,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_staff
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.core.response_cache import response_cache
+from app.api.deps import cache_scope, get_current_user, require_staff, Principal
+from app.api.pagination import PageParams, fetch_page
+from app.api.etags import check_row_not_modified, row_etag
+from app.api.export import ExportParams, stream_export
+from app.api.fields import FieldSelection, fetch_sparse_page, schema_columns
+from app.api.bulk import bulk_insert, bulk_update, check_batch_size, existing_ids
+from app.api.responses import list_response
+from app.api.scoping import remember_client_id
+from app.api.writes import insert_returning, update_returning
 from app.models.user import User
 from app.models.client import Client, ClientStatus
-from app.schemas.client import ClientCreate, ClientUpdate, ClientResponse
+from app.schemas.bulk import BulkResponse
+from app.schemas.client import (
+    ClientCreate, ClientUpdate, ClientResponse, ClientBulkCreate, ClientBulkUpdate,
+    ImportJobResponse,
+)
+from app.services.client_import import detect_format, import_jobs, run_import_file
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[ClientResponse])
 async def list_clients(
-    skip: int = 0,
-    limit: int = 50,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    fields: FieldSelection = Depends(),
     status: Optional[ClientStatus] = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_staff),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(require_staff),
 ):
-    """List all clients (staff/admin only)."""
+    """List all clients (staff/admin only); ?fields= limits the returned columns."""
+    async def build(db: AsyncSession):
+        query = _client_query(status)
+        
+        if fields:
+            return await fetch_sparse_page(db, query, Client, ClientResponse, fields, page, response)
+        
+        clients = await fetch_page(db, query, Client, page, response)
+        return list_response(clients, ClientResponse, response)
+    
+    return await response_cache.serve(request, db, cache_scope(current_user), ["clients"], build)
+
+
+def _client_query(status: Optional[ClientStatus]):
+    """Select clients matching the list filters."""
     query = select(Client)
     
     if status:
         query = query.where(Client.status == status)
     
-    query = query.offset(skip).limit(limit).order_by(Client.created_at.desc())
-    result = await db.execute(query)
-    
-    return result.scalars().all()
+    return query
+
+
+@router.get("/export")
+async def export_clients(
+    params: ExportParams = Depends(),
+    status: Optional[ClientStatus] = None,
+    current_user: Principal = Depends(require_staff),
+):
+    """Stream all matching clients as CSV, NDJSON or Parquet (staff/admin only)."""
+    columns = schema_columns(Client, ClientResponse, params.columns)
+    query = _client_query(status).order_by(Client.created_at.desc(), Client.id.desc())
+    return stream_export(query, columns, params, "clients")
 
 
 @router.post("/", response_model=ClientResponse, status_code=status.HTTP_201_CREATED)
@@ -54,23 +99,35 @@ async def create_client(
             detail="User already has a client profile",
         )
     
-    client = Client(
-        user_id=current_user.id,
-        **client_in.model_dump(),
+    client = await insert_returning(
+        db,
+        Client,
+        {"user_id": current_user.id, **client_in.model_dump()},
     )
-    db.add(client)
-    await db.flush()
-    await db.refresh(client)
+    response_cache.invalidate_on_commit(db, "clients")
+    remember_client_id(current_user.id, client.id)
     
     return client
 
 
 @router.get("/my", response_model=ClientResponse)
 async def get_my_client_profile(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get current user's client profile."""
+    """Get current user's client profile (supports If-None-Match)."""
+    cached = await check_row_not_modified(
+        db,
+        request,
+        "client",
+        select(Client.id, Client.updated_at, Client.created_at)
+        .where(Client.user_id == current_user.id),
+    )
+    if cached:
+        return cached
+    
     result = await db.execute(
         select(Client).where(Client.user_id == current_user.id)
     )
@@ -82,16 +139,156 @@ async def get_my_client_profile(
             detail="Client profile not found",
         )
     
+    remember_client_id(current_user.id, client.id)
+    response.headers["ETag"] = row_etag("client", client.id, client.updated_at, client.created_at)
     return client
 
 
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_clients(
+    items: List[ClientBulkCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_staff),
+):
+    """
+    Create many client profiles (staff/admin only).
+    
+    Items whose user does not exist or already has a client profile are
+    reported as failed; the rest are inserted in one statement.
+    """
+    check_batch_size(items)
+    
+    user_ids = {item.user_id for item in items}
+    result = await db.execute(
+        select(User.id, Client.id)
+        .outerjoin(Client, Client.user_id == User.id)
+        .where(User.id.in_(user_ids))
+    )
+    profiles = dict(result.all())
+    
+    errors = {}
+    seen = set()
+    for index, item in enumerate(items):
+        if item.user_id not in profiles:
+            errors[index] = "User not found"
+        elif profiles[item.user_id] is not None or item.user_id in seen:
+            errors[index] = "User already has a client profile"
+        seen.add(item.user_id)
+    
+    response = await bulk_insert(db, Client, [item.model_dump() for item in items], errors)
+    response_cache.invalidate_on_commit(db, "clients")
+    
+    for item, outcome in zip(items, response.results):
+        if outcome.id is not None:
+            remember_client_id(item.user_id, outcome.id)
+    
+    return response
+
+
+@router.patch("/bulk", response_model=BulkResponse)
+async def bulk_update_clients(
+    items: List[ClientBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_staff),
+):
+    """Update many clients by id (staff/admin only)."""
+    check_batch_size(items)
+    
+    managers = await existing_ids(db, User.id, (item.assigned_manager_id for item in items))
+    errors = {
+        index: "Assigned manager not found"
+        for index, item in enumerate(items)
+        if item.assigned_manager_id is not None and item.assigned_manager_id not in managers
+    }
+    
+    response_cache.invalidate_on_commit(db, "clients")
+    return await bulk_update(
+        db,
+        Client,
+        [item.model_dump(exclude_unset=True) for item in items],
+        errors,
+        not_found="Client not found",
+    )
+
+
+@router.post(
+    "/import",
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_clients(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="csv or parquet (default: from extension)"),
+    current_user: Principal = Depends(require_staff),
+):
+    """
+    Import clients from a CSV or Parquet file (staff/admin only).
+    
+    The upload is spooled to disk and imported in the background; poll
+    GET /clients/import/{job_id} for progress and rejected rows.
+    """
+    try:
+        fmt = detect_format(file.filename, format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    fd, path = tempfile.mkstemp(suffix=f".{fmt}")
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            while chunk := await file.read(1024 * 1024):
+                size += len(chunk)
+                if size > settings.IMPORT_MAX_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Import file too large",
+                    )
+                spool.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    
+    job = await import_jobs.create(file.filename or f"upload.{fmt}", fmt)
+    background_tasks.add_task(run_import_file, job, path)
+    return job
+
+
+@router.get("/import/{job_id}", response_model=ImportJobResponse)
+async def get_import_job(
+    job_id: str,
+    current_user: Principal = Depends(require_staff),
+):
+    """Get the progress of a client import (staff/admin only)."""
+    job = await import_jobs.get(job_id)
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found",
+        )
+    
+    return job
+
+
 @router.get("/{client_id}", response_model=ClientResponse)
 async def get_client(
     client_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_staff),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(require_staff),
 ):
-    """Get client by ID (staff/admin only)."""
+    """Get client by ID (staff/admin only; supports If-None-Match)."""
+    cached = await check_row_not_modified(
+        db,
+        request,
+        "client",
+        select(Client.id, Client.updated_at, Client.created_at).where(Client.id == client_id),
+    )
+    if cached:
+        return cached
+    
     result = await db.execute(select(Client).where(Client.id == client_id))
     client = result.scalar_one_or_none()
     
@@ -101,6 +298,7 @@ async def get_client(
             detail="Client not found",
         )
     
+    response.headers["ETag"] = row_etag("client", client.id, client.updated_at, client.created_at)
     return client
 
 
@@ -109,24 +307,14 @@ async def update_client(
     client_id: int,
     client_update: ClientUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_staff),
+    current_user: Principal = Depends(require_staff),
 ):
     """Update client (staff/admin only)."""
-    result = await db.execute(select(Client).where(Client.id == client_id))
-    client = result.scalar_one_or_none()
-    
-    if not client:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Client not found",
-        )
-    
-    update_data = client_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(client, field, value)
-    
-    await db.flush()
-    await db.refresh(client)
-    
-    return client
-
+    response_cache.invalidate_on_commit(db, "clients")
+    return await update_returning(
+        db,
+        Client,
+        client_id,
+        client_update.model_dump(exclude_unset=True),
+        not_found="Client not found",
+    )
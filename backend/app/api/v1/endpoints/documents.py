@@ -1,21 +1,50 @@
 """
 PATH: backend/app/api/v1/endpoints/documents.py
 PURPOSE: Document management endpoints
+
+NOTES FOR FUTURE AI:
+    - Two upload paths: POST /upload streams the file through the API;
+      POST /uploads + POST /{id}/complete let the client PUT straight to S3
+    - Direct uploads stay PENDING_UPLOAD until completed; only complete and
+      DELETE see them. A failed verification deletes the upload, and
+      abandoned ones are swept on the user's next POST /uploads
+    - GET /{id}/content proxies the file (with Range) for clients that
+      cannot reach presigned S3 URLs
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+import base64
+from typing import List, NoReturn, Optional
+from urllib.parse import quote
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.database import after_rollback, get_db, get_read_db
+from app.core.response_cache import response_cache
+from app.api.bulk import check_batch_size
+from app.api.deps import cache_scope, get_current_user, require_admin, Principal, RateLimit
+from app.api.etags import check_row_not_modified, row_etag
+from app.api.export import ExportParams, stream_export
+from app.api.fields import FieldSelection, fetch_sparse_page, schema_columns
+from app.api.pagination import PageParams, fetch_page
+from app.api.ranges import parse_range
+from app.api.responses import list_response
+from app.api.scoping import project_visible, scope_documents
+from app.api.writes import insert_returning, update_returning
 from app.models.user import User, UserRole
-from app.models.client import Client
-from app.models.project import Project
 from app.models.document import Document, DocumentStatus
-from app.schemas.document import DocumentCreate, DocumentResponse, DocumentSignRequest
-from app.services.s3 import S3Service
+from app.models.project import Project
+from app.schemas.document import (
+    DocumentCreate, DocumentResponse, DocumentSignRequest, DocumentStorageReport,
+    DocumentUploadComplete, DocumentUploadRequest, DocumentUploadResponse,
+    DocumentDownloadUrl, DocumentDownloadUrlsRequest, DocumentDownloadUrlsResponse,
+)
+from app.services.s3 import S3Service, StoredObject
+from app.services.document_store import (
+    release_blob, storage_report, store_blob, sweep_pending_uploads,
+)
 from app.services.docusign import DocuSignService
 
 router = APIRouter()
@@ -23,44 +52,66 @@ router = APIRouter()
 
 @router.get("/", response_model=List[DocumentResponse])
 async def list_documents(
-    skip: int = 0,
-    limit: int = 50,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    fields: FieldSelection = Depends(),
     project_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List documents (filtered by user role)."""
-    query = select(Document)
+    """List documents (filtered by user role); ?fields= limits the returned columns."""
+    async def build(db: AsyncSession):
+        query = _document_query(current_user, project_id)
+        
+        if fields:
+            return await fetch_sparse_page(db, query, Document, DocumentResponse, fields, page, response)
+        
+        documents = await fetch_page(db, query, Document, page, response)
+        return list_response(documents, DocumentResponse, response)
+    
+    return await response_cache.serve(request, db, cache_scope(current_user), ["documents"], build)
+
+
+def _document_query(current_user: User, project_id: Optional[int]):
+    """Select the documents visible to the user that match the list filters."""
+    query = select(Document).where(
+        Document.status.is_distinct_from(DocumentStatus.PENDING_UPLOAD)
+    )
     
     if project_id:
         query = query.where(Document.project_id == project_id)
     
     # Clients can only see their own documents
-    if current_user.role == UserRole.CLIENT:
-        result = await db.execute(
-            select(Client).where(Client.user_id == current_user.id)
-        )
-        client = result.scalar_one_or_none()
-        if client:
-            # Get client's project IDs
-            proj_result = await db.execute(
-                select(Project.id).where(Project.client_id == client.id)
-            )
-            project_ids = [r[0] for r in proj_result.all()]
-            if project_ids:
-                query = query.where(Document.project_id.in_(project_ids))
-            else:
-                return []
-        else:
-            return []
-    
-    query = query.offset(skip).limit(limit).order_by(Document.created_at.desc())
-    result = await db.execute(query)
-    
-    return result.scalars().all()
+    return scope_documents(query, current_user)
 
 
-@router.post("/upload", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
+@router.get("/export")
+async def export_documents(
+    params: ExportParams = Depends(),
+    project_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Stream matching document metadata as CSV, NDJSON or Parquet."""
+    columns = schema_columns(Document, DocumentResponse, params.columns)
+    query = _document_query(current_user, project_id)
+    query = query.order_by(Document.created_at.desc(), Document.id.desc())
+    return stream_export(query, columns, params, "documents")
+
+
+@router.post(
+    "/upload",
+    response_model=DocumentResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[
+        Depends(RateLimit(
+            "document-upload",
+            settings.DOCUMENT_UPLOAD_RATE_LIMIT_PER_USER,
+            60,
+            per="user",
+        )),
+    ],
+)
 async def upload_document(
     file: UploadFile = File(...),
     project_id: Optional[int] = None,
@@ -68,43 +119,290 @@ async def upload_document(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Upload a document to S3."""
-    # Read file content
-    content = await file.read()
+    """Upload a document to S3 (streamed, hashed and deduplicated by content)."""
+    if project_id:
+        await _check_project_visible(db, project_id, current_user)
     
-    # Upload to S3
     s3_service = S3Service()
-    s3_key = await s3_service.upload_file(
-        content=content,
+    stored = await s3_service.upload_stream(
+        file,
         filename=file.filename,
         content_type=file.content_type,
     )
     
+    # Nothing references the fresh object if the request fails from here on
+    async def _delete_upload() -> None:
+        await s3_service.delete_file(stored.key)
+    
+    after_rollback(db, _delete_upload)
+    s3_key = await store_blob(db, s3_service, stored)
+    
     # Create document record
-    document = Document(
-        project_id=project_id,
-        uploaded_by_id=current_user.id,
-        name=file.filename,
-        s3_key=s3_key,
-        mime_type=file.content_type,
-        size_bytes=len(content),
-        category=category,
-    )
-    db.add(document)
-    await db.flush()
-    await db.refresh(document)
+    response_cache.invalidate_on_commit(db, "documents")
+    return await insert_returning(
+        db,
+        Document,
+        {
+            "project_id": project_id,
+            "uploaded_by_id": current_user.id,
+            "name": file.filename,
+            "s3_key": s3_key,
+            "mime_type": file.content_type,
+            "size_bytes": stored.size_bytes,
+            "sha256_hash": stored.sha256,
+            "category": category,
+        },
+    )
+
+
+@router.post(
+    "/uploads",
+    response_model=DocumentUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[
+        Depends(RateLimit(
+            "document-upload",
+            settings.DOCUMENT_UPLOAD_RATE_LIMIT_PER_USER,
+            60,
+            per="user",
+        )),
+    ],
+)
+async def request_upload(
+    upload: DocumentUploadRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Start a direct-to-S3 upload.
     
-    return document
+    Creates a pending document and returns presigned URL(s) to upload to.
+    Call POST /{document_id}/complete once the upload has finished.
+    """
+    if upload.project_id:
+        await _check_project_visible(db, upload.project_id, current_user)
+    
+    s3_service = S3Service()
+    await sweep_pending_uploads(db, s3_service, current_user.id)
+    
+    expires_in = settings.S3_UPLOAD_URL_EXPIRE_SECONDS
+    presigned = await s3_service.create_presigned_upload(
+        filename=upload.name,
+        content_type=upload.mime_type,
+        size_bytes=upload.size_bytes,
+        sha256=upload.sha256,
+        expires_in=expires_in,
+    )
+    
+    document = await insert_returning(
+        db,
+        Document,
+        {
+            "project_id": upload.project_id,
+            "uploaded_by_id": current_user.id,
+            "name": upload.name,
+            "s3_key": presigned.key,
+            "mime_type": upload.mime_type,
+            "size_bytes": upload.size_bytes,
+            # Only a single PUT is checksummed by S3, so only then can the
+            # hash be trusted for deduplication
+            "sha256_hash": upload.sha256.lower() if upload.sha256 and presigned.url else None,
+            "category": upload.category,
+            "description": upload.description,
+            "status": DocumentStatus.PENDING_UPLOAD,
+        },
+    )
+    
+    return DocumentUploadResponse(
+        document_id=document.id,
+        upload_url=presigned.url,
+        upload_headers=presigned.headers or {},
+        upload_id=presigned.upload_id,
+        part_size=presigned.part_size,
+        part_urls=presigned.part_urls or [],
+        expires_in=expires_in,
+    )
+
+
+@router.post("/{document_id}/complete", response_model=DocumentResponse)
+async def complete_upload(
+    document_id: int,
+    completion: DocumentUploadComplete,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Verify a direct upload against its declared size and hash, then activate it."""
+    # Lock the row so concurrent completions run one after the other; the
+    # second then sees UPLOADED and gets 409 instead of taking a second
+    # blob reference
+    result = await db.execute(
+        select(Document)
+        .where(
+            Document.id == document_id,
+            Document.uploaded_by_id == current_user.id,
+        )
+        .with_for_update()
+    )
+    document = result.scalar_one_or_none()
+    
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found",
+        )
+    
+    if document.status != DocumentStatus.PENDING_UPLOAD:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload already completed",
+        )
+    
+    s3_service = S3Service()
+    if completion.upload_id:
+        completed = await s3_service.complete_multipart_upload(
+            document.s3_key,
+            completion.upload_id,
+            [{"PartNumber": p.part_number, "ETag": p.etag} for p in completion.parts],
+        )
+        if not completed:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Upload parts were rejected",
+            )
+    
+    head = await s3_service.head_file(document.s3_key)
+    if head is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File has not been uploaded",
+        )
+    
+    if head["ContentLength"] != document.size_bytes:
+        await _reject_upload(db, s3_service, document, "Uploaded size does not match")
+    
+    s3_key = document.s3_key
+    if document.sha256_hash:
+        expected = base64.b64encode(bytes.fromhex(document.sha256_hash)).decode()
+        if head.get("ChecksumSHA256") != expected:
+            await _reject_upload(db, s3_service, document, "Uploaded content does not match sha256")
+        s3_key = await store_blob(
+            db,
+            s3_service,
+            StoredObject(key=s3_key, size_bytes=document.size_bytes, sha256=document.sha256_hash),
+        )
+    
+    response_cache.invalidate_on_commit(db, "documents")
+    return await update_returning(
+        db,
+        Document,
+        document_id,
+        {"status": DocumentStatus.UPLOADED, "s3_key": s3_key},
+        not_found="Document not found",
+    )
+
+
+async def _check_project_visible(db: AsyncSession, project_id: int, current_user: User) -> None:
+    """Raise 404 unless the project exists and the user may see it."""
+    result = await db.execute(
+        select(Project.id).where(Project.id == project_id, project_visible(current_user))
+    )
+    if result.first() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+
+async def _reject_upload(
+    db: AsyncSession,
+    s3_service: S3Service,
+    document: Document,
+    detail: str,
+) -> NoReturn:
+    """
+    Discard a direct upload that failed verification and raise 400.
+    
+    The pending row is deleted and committed before raising, since get_db
+    rolls back on errors; the client has to request a new upload.
+    """
+    s3_key = document.s3_key
+    await db.delete(document)
+    await db.commit()
+    await s3_service.delete_file(s3_key)
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=detail,
+    )
+
+
+@router.get("/storage-report", response_model=DocumentStorageReport)
+async def get_storage_report(
+    db: AsyncSession = Depends(get_read_db),
+    _: Principal = Depends(require_admin),
+):
+    """Bytes stored vs. referenced, and bytes saved by deduplication (admin only)."""
+    return await storage_report(db)
+
+
+@router.post("/download-urls", response_model=DocumentDownloadUrlsResponse)
+async def get_download_urls(
+    batch: DocumentDownloadUrlsRequest,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Presigned download URLs for many documents at once.
+    
+    Access is checked for the whole batch in one query; ids the caller
+    cannot see are listed in not_found.
+    """
+    check_batch_size(batch.document_ids)
+    ids = list(dict.fromkeys(batch.document_ids))
+    
+    query = _document_query(current_user, None).with_only_columns(Document.id, Document.s3_key)
+    result = await db.execute(query.where(Document.id.in_(ids)))
+    keys = dict(result.all())
+    
+    s3_service = S3Service()
+    urls = []
+    for document_id in ids:
+        if document_id in keys:
+            url, expires_in = s3_service.presign_download(keys[document_id])
+            urls.append(DocumentDownloadUrl(
+                document_id=document_id,
+                download_url=url,
+                expires_in=expires_in,
+            ))
+    
+    return DocumentDownloadUrlsResponse(
+        urls=urls,
+        not_found=[document_id for document_id in ids if document_id not in keys],
+    )
 
 
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get document metadata."""
-    result = await db.execute(select(Document).where(Document.id == document_id))
+    """Get document metadata (supports If-None-Match)."""
+    cached = await check_row_not_modified(
+        db,
+        request,
+        "document",
+        _document_query(current_user, None)
+        .with_only_columns(Document.id, Document.updated_at, Document.created_at)
+        .where(Document.id == document_id),
+    )
+    if cached:
+        return cached
+    
+    result = await db.execute(
+        _document_query(current_user, None).where(Document.id == document_id)
+    )
     document = result.scalar_one_or_none()
     
     if not document:
@@ -113,17 +411,22 @@ async def get_document(
             detail="Document not found",
         )
     
+    response.headers["ETag"] = row_etag(
+        "document", document.id, document.updated_at, document.created_at
+    )
     return document
 
 
 @router.get("/{document_id}/download")
 async def download_document(
     document_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get presigned download URL."""
-    result = await db.execute(select(Document).where(Document.id == document_id))
+    result = await db.execute(
+        _document_query(current_user, None).where(Document.id == document_id)
+    )
     document = result.scalar_one_or_none()
     
     if not document:
@@ -132,10 +435,90 @@ async def download_document(
             detail="Document not found",
         )
     
-    s3_service = S3Service()
-    download_url = await s3_service.get_download_url(document.s3_key)
+    download_url, expires_in = S3Service().presign_download(document.s3_key)
+    
+    return {"download_url": download_url, "expires_in": expires_in}
+
+
+@router.get("/{document_id}/content")
+async def stream_document_content(
+    document_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream the file inline through the API (supports single HTTP Range requests)."""
+    query = (
+        _document_query(current_user, None)
+        .with_only_columns(Document.s3_key, Document.size_bytes, Document.mime_type, Document.name)
+        .where(Document.id == document_id)
+    )
+    document = (await db.execute(query)).one_or_none()
+    
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found",
+        )
+    
+    byte_range = parse_range(request.headers.get("range"), document.size_bytes)
+    first_byte, last_byte = byte_range or (None, None)
+    stream = await S3Service().open_stream(document.s3_key, first_byte, last_byte)
+    
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(stream.content_length),
+        "Content-Disposition": f"inline; filename*=UTF-8''{quote(document.name)}",
+    }
+    if byte_range:
+        headers["Content-Range"] = (
+            stream.content_range or f"bytes {first_byte}-{last_byte}/{document.size_bytes}"
+        )
+    
+    return StreamingResponse(
+        stream.chunks,
+        status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+        media_type=document.mime_type,
+        headers=headers,
+    )
+
+
+@router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_document(
+    document_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete a document; its S3 object goes with the last reference to it."""
+    result = await db.execute(
+        scope_documents(select(Document), current_user).where(Document.id == document_id)
+    )
+    document = result.scalar_one_or_none()
+    
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found",
+        )
     
-    return {"download_url": download_url, "expires_in": 3600}
+    if current_user.role == UserRole.CLIENT and document.uploaded_by_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+    
+    newer = await db.execute(
+        select(Document.id).where(Document.parent_document_id == document_id).limit(1)
+    )
+    if newer.first() is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Document has newer versions",
+        )
+    
+    await release_blob(db, S3Service(), document)
+    await db.delete(document)
+    response_cache.invalidate_on_commit(db, "documents")
 
 
 @router.post("/{document_id}/sign")
@@ -146,7 +529,9 @@ async def send_for_signature(
     current_user: User = Depends(get_current_user),
 ):
     """Send document to DocuSign for signature."""
-    result = await db.execute(select(Document).where(Document.id == document_id))
+    result = await db.execute(
+        _document_query(current_user, None).where(Document.id == document_id)
+    )
     document = result.scalar_one_or_none()
     
     if not document:
@@ -174,6 +559,7 @@ async def send_for_signature(
     document.docusign_envelope_id = envelope_id
     document.status = DocumentStatus.PENDING_SIGNATURE
     await db.flush()
+    response_cache.invalidate_on_commit(db, "documents")
     
     return {"envelope_id": envelope_id, "status": "sent"}
 
@@ -0,0 +1,44 @@
+"""
+PATH: backend/app/api/v1/endpoints/metrics.py
+PURPOSE: Operational metrics endpoints (admin only)
+
+NOTES FOR FUTURE AI:
+    - Values are per worker process
+"""
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import require_admin, Principal
+from app.core.database import pool_stats, replica_engine, round_trip_stats
+from app.core.principal_cache import principal_cache
+from app.core.response_cache import response_cache
+from app.services.s3 import download_url_cache
+
+router = APIRouter()
+
+
+@router.get("/database")
+async def database_metrics(
+    _: Principal = Depends(require_admin),
+):
+    """Connection pool usage, checkout wait, connect latency and round trips per endpoint."""
+    return {
+        "pool": pool_stats(),
+        "replica_pool": pool_stats(replica_engine) if replica_engine else None,
+        "round_trips": {
+            endpoint: histogram.snapshot()
+            for endpoint, histogram in sorted(round_trip_stats.items())
+        },
+    }
+
+
+@router.get("/cache")
+async def cache_metrics(
+    _: Principal = Depends(require_admin),
+):
+    """Hit/miss counters for in-process caches."""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "download_url_cache": download_url_cache.stats(),
+    }
@@ -4,64 +4,102 @@ PURPOSE: Project management endpoints
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_staff
+from app.core.database import get_db, get_read_db
+from app.core.response_cache import response_cache
+from app.api.deps import cache_scope, get_current_user, require_staff, Principal
+from app.api.etags import check_row_not_modified, row_etag
+from app.api.export import ExportParams, stream_export
+from app.api.fields import FieldSelection, fetch_sparse_page, schema_columns
+from app.api.bulk import bulk_insert, bulk_update, check_batch_size, existing_ids
+from app.api.pagination import PageParams, fetch_page
+from app.api.responses import list_response
+from app.api.scoping import project_visible, remember_client_id, scope_projects
+from app.api.writes import insert_returning, update_returning
 from app.models.user import User, UserRole
 from app.models.client import Client
 from app.models.project import Project, ProjectStatus
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.schemas.bulk import BulkResponse
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectBulkUpdate
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[ProjectResponse])
 async def list_projects(
-    skip: int = 0,
-    limit: int = 50,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    fields: FieldSelection = Depends(),
     status: Optional[ProjectStatus] = None,
     client_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List projects (filtered by user role)."""
+    """List projects (filtered by user role); ?fields= limits the returned columns."""
+    async def build(db: AsyncSession):
+        query = _project_query(current_user, status, client_id)
+        
+        if fields:
+            return await fetch_sparse_page(db, query, Project, ProjectResponse, fields, page, response)
+        
+        projects = await fetch_page(db, query, Project, page, response)
+        
+        if projects and current_user.role == UserRole.CLIENT:
+            remember_client_id(current_user.id, projects[0].client_id)
+        
+        return list_response(projects, ProjectResponse, response)
+    
+    return await response_cache.serve(request, db, cache_scope(current_user), ["projects"], build)
+
+
+def _project_query(
+    current_user: User,
+    status: Optional[ProjectStatus],
+    client_id: Optional[int],
+):
+    """Select the projects visible to the user that match the list filters."""
     query = select(Project)
     
     # Clients can only see their own projects
     if current_user.role == UserRole.CLIENT:
-        result = await db.execute(
-            select(Client).where(Client.user_id == current_user.id)
-        )
-        client = result.scalar_one_or_none()
-        if client:
-            query = query.where(Project.client_id == client.id)
-        else:
-            return []
+        query = scope_projects(query, current_user)
     elif client_id:
         query = query.where(Project.client_id == client_id)
     
     if status:
         query = query.where(Project.status == status)
     
-    query = query.offset(skip).limit(limit).order_by(Project.created_at.desc())
-    result = await db.execute(query)
-    
-    return result.scalars().all()
+    return query
+
+
+@router.get("/export")
+async def export_projects(
+    params: ExportParams = Depends(),
+    status: Optional[ProjectStatus] = None,
+    client_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Stream matching projects as CSV, NDJSON or Parquet."""
+    columns = schema_columns(Project, ProjectResponse, params.columns)
+    query = _project_query(current_user, status, client_id)
+    query = query.order_by(Project.created_at.desc(), Project.id.desc())
+    return stream_export(query, columns, params, "projects")
 
 
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_in: ProjectCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_staff),
+    current_user: Principal = Depends(require_staff),
 ):
     """Create a new project (staff/admin only)."""
     # Verify client exists
     result = await db.execute(
-        select(Client).where(Client.id == project_in.client_id)
+        select(Client.id).where(Client.id == project_in.client_id)
     )
     if not result.scalar_one_or_none():
         raise HTTPException(
@@ -69,42 +107,99 @@ async def create_project(
             detail="Client not found",
         )
     
-    project = Project(**project_in.model_dump())
-    db.add(project)
-    await db.flush()
-    await db.refresh(project)
+    response_cache.invalidate_on_commit(db, "projects")
+    return await insert_returning(db, Project, project_in.model_dump())
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_projects(
+    items: List[ProjectCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_staff),
+):
+    """
+    Create many projects (staff/admin only).
     
-    return project
+    All client ids are checked in one query; items for unknown clients
+    are reported as failed and the rest are inserted in one statement.
+    """
+    check_batch_size(items)
+    
+    clients = await existing_ids(db, Client.id, (item.client_id for item in items))
+    errors = {
+        index: "Client not found"
+        for index, item in enumerate(items)
+        if item.client_id not in clients
+    }
+    
+    response_cache.invalidate_on_commit(db, "projects")
+    return await bulk_insert(db, Project, [item.model_dump() for item in items], errors)
+
+
+@router.patch("/bulk", response_model=BulkResponse)
+async def bulk_update_projects(
+    items: List[ProjectBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_staff),
+):
+    """Update many projects by id (staff/admin only)."""
+    check_batch_size(items)
+    
+    response_cache.invalidate_on_commit(db, "projects")
+    return await bulk_update(
+        db,
+        Project,
+        [item.model_dump(exclude_unset=True) for item in items],
+        {},
+        not_found="Project not found",
+    )
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get project by ID."""
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
+    """Get project by ID (supports If-None-Match)."""
+    cached = await check_row_not_modified(
+        db,
+        request,
+        "project",
+        select(Project.id, Project.updated_at, Project.created_at)
+        .where(Project.id == project_id, project_visible(current_user)),
+    )
+    if cached:
+        return cached
+    
+    # Load the project and the caller's access to it in one statement
+    result = await db.execute(
+        select(Project, project_visible(current_user).label("visible"))
+        .where(Project.id == project_id)
+    )
+    row = result.one_or_none()
     
-    if not project:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
     
+    project, visible = row
+    
     # Check access
-    if current_user.role == UserRole.CLIENT:
-        client_result = await db.execute(
-            select(Client).where(Client.user_id == current_user.id)
+    if not visible:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
         )
-        client = client_result.scalar_one_or_none()
-        if not client or project.client_id != client.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied",
-            )
     
+    if current_user.role == UserRole.CLIENT:
+        remember_client_id(current_user.id, project.client_id)
+    
+    response.headers["ETag"] = row_etag("project", project.id, project.updated_at, project.created_at)
     return project
 
 
@@ -113,24 +208,14 @@ async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_staff),
+    current_user: Principal = Depends(require_staff),
 ):
     """Update project (staff/admin only)."""
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    
-    update_data = project_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-    
-    await db.flush()
-    await db.refresh(project)
-    
-    return project
-
+    response_cache.invalidate_on_commit(db, "projects")
+    return await update_returning(
+        db,
+        Project,
+        project_id,
+        project_update.model_dump(exclude_unset=True),
+        not_found="Project not found",
+    )
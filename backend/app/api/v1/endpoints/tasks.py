@@ -0,0 +1,71 @@
+"""
+PATH: backend/app/api/v1/endpoints/tasks.py
+PURPOSE: Task management endpoints
+"""
+
+from typing import List
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.api.deps import require_staff, Principal
+from app.api.bulk import bulk_insert, bulk_update, check_batch_size, existing_ids
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.bulk import BulkResponse
+from app.schemas.task import TaskCreate, TaskBulkUpdate
+
+router = APIRouter()
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_tasks(
+    items: List[TaskCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_staff),
+):
+    """
+    Create many tasks (staff/admin only).
+    
+    Project and assignee ids are checked in one query each; items that
+    reference unknown rows are reported as failed.
+    """
+    check_batch_size(items)
+    
+    projects = await existing_ids(db, Project.id, (item.project_id for item in items))
+    assignees = await existing_ids(db, User.id, (item.assignee_id for item in items))
+    
+    errors = {}
+    for index, item in enumerate(items):
+        if item.project_id not in projects:
+            errors[index] = "Project not found"
+        elif item.assignee_id is not None and item.assignee_id not in assignees:
+            errors[index] = "Assignee not found"
+    
+    return await bulk_insert(db, Task, [item.model_dump() for item in items], errors)
+
+
+@router.patch("/bulk", response_model=BulkResponse)
+async def bulk_update_tasks(
+    items: List[TaskBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_staff),
+):
+    """Update many tasks by id (staff/admin only)."""
+    check_batch_size(items)
+    
+    assignees = await existing_ids(db, User.id, (item.assignee_id for item in items))
+    errors = {
+        index: "Assignee not found"
+        for index, item in enumerate(items)
+        if item.assignee_id is not None and item.assignee_id not in assignees
+    }
+    
+    return await bulk_update(
+        db,
+        Task,
+        [item.model_dump(exclude_unset=True) for item in items],
+        errors,
+        not_found="Task not found",
+    )
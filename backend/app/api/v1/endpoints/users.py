@@ -4,12 +4,19 @@ PURPOSE: User management endpoints
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_admin
+from app.core.database import get_db, get_read_db
+from app.core.principal_cache import principal_cache
+from app.core.revocation import revocations
+from app.api.deps import get_current_user, require_admin, Principal
+from app.api.etags import check_row_not_modified, row_etag
+from app.api.fields import FieldSelection, fetch_sparse_page
+from app.api.pagination import PageParams, fetch_page
+from app.api.responses import list_response
+from app.api.writes import update_returning
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
 
@@ -18,10 +25,30 @@ router = APIRouter()
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get current authenticated user info."""
-    return current_user
+    """Get current authenticated user info (supports If-None-Match)."""
+    # current_user may come from the principal cache, so the version is
+    # read from the row itself
+    cached = await check_row_not_modified(
+        db,
+        request,
+        "user",
+        select(User.id, User.updated_at, User.created_at).where(User.id == current_user.id),
+    )
+    if cached:
+        return cached
+    
+    result = await db.execute(select(User).where(User.id == current_user.id))
+    user = result.scalar_one_or_none()
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    
+    response.headers["ETag"] = row_etag("user", user.id, user.updated_at, user.created_at)
+    return user
 
 
 @router.patch("/me", response_model=UserResponse)
@@ -32,35 +59,44 @@ async def update_current_user(
 ):
     """Update current user's profile."""
     update_data = user_update.model_dump(exclude_unset=True)
+    was_active = current_user.is_active
     
-    for field, value in update_data.items():
-        setattr(current_user, field, value)
-    
-    await db.flush()
-    await db.refresh(current_user)
+    user = await update_returning(
+        db,
+        User,
+        current_user.id,
+        update_data,
+        not_found="User not found",
+    )
+    principal_cache.invalidate_on_commit(db, current_user.id)
+    if user.is_active != was_active:
+        await revocations.revoke(db, current_user.id)
     
-    return current_user
+    return user
 
 
 @router.get("/", response_model=List[UserResponse])
 async def list_users(
-    skip: int = 0,
-    limit: int = 50,
-    db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_admin),
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    fields: FieldSelection = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+    _: Principal = Depends(require_admin),
 ):
-    """List all users (admin only)."""
-    result = await db.execute(
-        select(User).offset(skip).limit(limit).order_by(User.created_at.desc())
-    )
-    return result.scalars().all()
+    """List all users (admin only); ?fields= limits the returned columns."""
+    if fields:
+        return await fetch_sparse_page(db, select(User), User, UserResponse, fields, page, response)
+    
+    users = await fetch_page(db, select(User), User, page, response)
+    return list_response(users, UserResponse, response, request)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_read_db),
+    _: Principal = Depends(require_admin),
 ):
     """Get user by ID (admin only)."""
     result = await db.execute(select(User).where(User.id == user_id))
@@ -6,13 +6,15 @@ ROLE IN ARCHITECTURE: Central router for all v1 endpoints
 NOTES FOR FUTURE AI:
     - Add new endpoint routers here
     - Keep consistent prefix naming
+    - Responses render with FastJSONResponse (pydantic-core) by default
 """
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, users, clients, projects, documents, ai
+from app.api.responses import FastJSONResponse
+from app.api.v1.endpoints import auth, users, clients, projects, tasks, documents, ai, metrics
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=FastJSONResponse)
 
 # Authentication
 api_router.include_router(
@@ -42,6 +44,13 @@ api_router.include_router(
     tags=["Projects"],
 )
 
+# Tasks
+api_router.include_router(
+    tasks.router,
+    prefix="/tasks",
+    tags=["Tasks"],
+)
+
 # Documents
 api_router.include_router(
     documents.router,
@@ -56,3 +65,10 @@ api_router.include_router(
     tags=["AI Assistant"],
 )
 
+
+# Metrics
+api_router.include_router(
+    metrics.router,
+    prefix="/metrics",
+    tags=["Metrics"],
+)
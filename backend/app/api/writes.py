@@ -0,0 +1,138 @@
+"""
+PATH: backend/app/api/writes.py
+PURPOSE: Single-statement write helpers using RETURNING
+ROLE IN ARCHITECTURE: Write path for create/PATCH handlers
+
+MAIN EXPORTS:
+    - insert_returning: INSERT ... RETURNING, optionally ON CONFLICT DO NOTHING
+    - upsert_returning: INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+    - update_returning: UPDATE ... WHERE id = ... RETURNING, 404 on no row
+
+NOTES FOR FUTURE AI:
+    - Each helper is one round-trip and returns a session-attached ORM object,
+      so there is no need to flush() or refresh() afterwards
+    - Column defaults and onupdate (e.g. updated_at) are applied as usual
+    - ON CONFLICT is supported on PostgreSQL and SQLite
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+_UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+async def insert_returning(
+    db: AsyncSession,
+    model: Any,
+    values: Dict[str, Any],
+    on_conflict_do_nothing: Optional[Sequence[str]] = None,
+) -> Optional[Any]:
+    """
+    Insert one row and return it as an ORM object.
+
+    Args:
+        db: Session to execute on
+        model: Mapped class to insert into
+        values: Column values
+        on_conflict_do_nothing: Unique columns; if the row conflicts on them
+            nothing is inserted and None is returned
+
+    Returns:
+        The inserted object, or None on conflict
+    """
+    if on_conflict_do_nothing:
+        dialect = db.get_bind().dialect.name
+        stmt = _UPSERT_DIALECTS[dialect](model).values(**values)
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(on_conflict_do_nothing))
+    else:
+        stmt = insert(model).values(**values)
+
+    result = await db.execute(stmt.returning(model))
+    return result.scalar_one_or_none()
+
+
+async def upsert_returning(
+    db: AsyncSession,
+    model: Any,
+    values: Dict[str, Any],
+    conflict_columns: Sequence[str],
+    on_conflict_set: Dict[str, Any],
+) -> Any:
+    """
+    Insert one row, or update the existing one, and return it as an ORM object.
+
+    Args:
+        db: Session to execute on
+        model: Mapped class to insert into
+        values: Column values for a new row
+        conflict_columns: Unique columns identifying an existing row
+        on_conflict_set: Values to set on the existing row instead; may refer
+            to its current columns (e.g. {"n": model.n + 1})
+    """
+    dialect = db.get_bind().dialect.name
+    stmt = _UPSERT_DIALECTS[dialect](model).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_=on_conflict_set,
+    )
+
+    result = await db.execute(
+        stmt.returning(model).execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def update_returning(
+    db: AsyncSession,
+    model: Any,
+    row_id: int,
+    values: Dict[str, Any],
+    not_found: str,
+) -> Any:
+    """
+    Update one row by primary key and return it as an ORM object.
+
+    Args:
+        db: Session to execute on
+        model: Mapped class with an `id` column
+        row_id: Primary key of the row to update
+        values: Columns to change (an empty dict just loads the row)
+        not_found: 404 detail when no row matches
+
+    Raises:
+        HTTPException 404: No row with this id
+    """
+    if values:
+        # RETURNING does not overwrite attributes of a copy this session has
+        # already loaded (populate_existing is ignored for DML), so expire it
+        # and let the returned row fill it in
+        loaded = db.identity_map.get(db.identity_key(model, row_id))
+        if loaded is not None:
+            db.expire(loaded)
+        stmt = (
+            update(model)
+            .where(model.id == row_id)
+            .values(**values)
+            .returning(model)
+        )
+    else:
+        stmt = select(model).where(model.id == row_id)
+
+    result = await db.execute(stmt)
+    row = result.scalar_one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found,
+        )
+
+    return row
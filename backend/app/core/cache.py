@@ -0,0 +1,93 @@
+"""
+PATH: backend/app/core/cache.py
+PURPOSE: In-process caching primitives
+ROLE IN ARCHITECTURE: Shared building block for hot-path caches
+
+MAIN EXPORTS:
+    - TTLCache: Size-bounded LRU cache with per-entry expiry and hit/miss counters
+
+NOTES FOR FUTURE AI:
+    - Not thread-safe; intended for use on the event loop only
+    - Values are stored by reference, so cache immutable data (dicts you never mutate)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Least-recently-used cache with a time-to-live per entry.
+    
+    Entries expire after `ttl_seconds` (or a per-entry override passed to
+    `set`). When the cache is full the least recently used entry is evicted.
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional lifetime in seconds overriding the cache default
+        """
+        ttl = self.ttl_seconds if ttl is None else ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+    
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._data)
@@ -7,18 +7,146 @@ MAIN EXPORTS:
     - engine: SQLAlchemy async engine
     - AsyncSessionLocal: Session factory
     - get_db: Dependency for route handlers
+    - after_commit: Register work to run after get_db commits
+    - after_rollback: Register cleanup to run after get_db rolls back
+    - get_read_db: Dependency for read-only handlers (autocommit, routes to the replica)
+    - primary_read_session: Short AUTOCOMMIT read on the primary (e.g. auth lookups)
+    - reads_from_replica: Whether a read session is on the replica
+    - open_stream_session: Read-only transactional session for streaming exports
     - Base: Declarative base for models
+    - sort_time: Timestamp expression used for paging order and indexes
+    - now_precise: Current time with sub-second precision on every dialect
+    - warm_up_pool: Pre-open pool connections at startup
+    - pool_stats: Live pool metrics
+    - RoundTripMiddleware: Counts each request's database round trips
+    - round_trip_stats: Round trips per request, by endpoint
 
 NOTES FOR FUTURE AI:
     - Use get_db as a FastAPI dependency
     - All models should inherit from Base
+    - Pool sizing is configured through the DB_* settings
+    - get_read_db uses DATABASE_REPLICA_URL when set, except within
+      READ_YOUR_WRITES_SECONDS of a write by the same user, or while the
+      replica is marked unhealthy. Write markers are per worker process.
+    - Read sessions run in AUTOCOMMIT with no BEGIN/COMMIT and refuse to
+      flush, so never use get_read_db in a handler that writes
+    - A round trip is a statement, a BEGIN/COMMIT/ROLLBACK outside
+      AUTOCOMMIT, or the pre-ping of a reused pooled connection. Opening a
+      connection is timed in pool_stats, not counted
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from sqlalchemy import DateTime, event, func
+from sqlalchemy.exc import DBAPIError, InvalidRequestError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql.functions import FunctionElement
+
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.metrics import Histogram
+from app.core.security import token_subject
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_time = Histogram()
+        self.connect_time = Histogram()
+    
+    def _do_get(self):
+        # QueuePool has no "before checkout" event, so time the internal
+        # getter; this covers queueing and any overflow connection opened.
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_time.observe(time.perf_counter() - started)
+
+
+def _engine_kwargs(url: str) -> Dict[str, Any]:
+    """Build pool and driver options for a database URL."""
+    kwargs: Dict[str, Any] = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        kwargs["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        }
+    return kwargs
+
+
+ROUND_TRIPS_HEADER = "X-DB-Round-Trips"
+ROUND_TRIP_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 50)
+
+# Round trips per request, keyed by endpoint ("module.function")
+round_trip_stats: Dict[str, Histogram] = {}
+
+# Round trips of the request being handled; None outside a request
+_request_round_trips: ContextVar[Optional[List[int]]] = ContextVar(
+    "request_round_trips", default=None
+)
+
+
+def _count_round_trip() -> None:
+    counter = _request_round_trips.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def _instrument(async_engine: AsyncEngine) -> None:
+    """Record connect latency on the engine's pool and count round trips."""
+    sync_engine = async_engine.sync_engine
+    pool = sync_engine.pool
+    
+    @event.listens_for(sync_engine, "do_connect")
+    def _before_connect(dialect, conn_rec, cargs, cparams):
+        conn_rec.info["connect_started"] = time.perf_counter()
+    
+    @event.listens_for(pool, "connect")
+    def _after_connect(dbapi_connection, conn_rec):
+        started = conn_rec.info.pop("connect_started", None)
+        if started is not None:
+            pool.connect_time.observe(time.perf_counter() - started)
+        conn_rec.info["fresh"] = True
+    
+    @event.listens_for(pool, "checkout")
+    def _checkout(dbapi_connection, conn_rec, connection_proxy):
+        # The pool pre-pings reused connections, never freshly opened ones
+        if not conn_rec.info.pop("fresh", False) and pool._pre_ping:
+            _count_round_trip()
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _statement(conn, cursor, statement, parameters, context, executemany):
+        _count_round_trip()
+    
+    def _transaction_control(conn):
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            _count_round_trip()
+    
+    for name in ("begin", "commit", "rollback"):
+        event.listen(sync_engine, name, _transaction_control)
 
 
 # Create async engine
@@ -26,7 +154,20 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    **_engine_kwargs(settings.DATABASE_URL),
 )
+_instrument(engine)
+
+# Optional read replica
+replica_engine: Optional[AsyncEngine] = None
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        echo=settings.DEBUG,
+        future=True,
+        **_engine_kwargs(settings.DATABASE_REPLICA_URL),
+    )
+    _instrument(replica_engine)
 
 # Session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -37,11 +178,95 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+
+
+class ReadOnlySession(Session):
+    """Session for read-only handlers; flushing raises."""
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_flush(session, flush_context, instances):
+    raise InvalidRequestError("Read-only session cannot flush changes")
+
+
+def _read_sessionmaker(target: AsyncEngine, autocommit: bool = True) -> async_sessionmaker:
+    """Session factory for reads; AUTOCOMMIT by default, so reads skip BEGIN and COMMIT."""
+    if autocommit:
+        target = target.execution_options(isolation_level="AUTOCOMMIT")
+    return async_sessionmaker(
+        target,
+        class_=AsyncSession,
+        sync_session_class=ReadOnlySession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+
+ReadSessionLocal = _read_sessionmaker(engine)
+ReplicaSessionLocal = _read_sessionmaker(replica_engine) if replica_engine else None
+
+# Server-side cursors need a transaction, so streaming reads are not AUTOCOMMIT
+StreamSessionLocal = _read_sessionmaker(engine, autocommit=False)
+ReplicaStreamSessionLocal = (
+    _read_sessionmaker(replica_engine, autocommit=False) if replica_engine else None
+)
+
+# Users who wrote recently, so their reads see their own changes
+_recent_writers = TTLCache(max_size=100000, ttl_seconds=settings.READ_YOUR_WRITES_SECONDS)
+_replica_down_until = 0.0
+
 # Base class for models
 Base = declarative_base()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+class sort_time(FunctionElement):
+    """
+    A timestamp as ordered and compared for paging.
+    
+    Renders as its argument, except on SQLite where text timestamps are
+    rewritten to one fixed-width format so they compare chronologically.
+    Paging indexes are declared on this expression so SQLite can use them;
+    on PostgreSQL they are plain column indexes.
+    """
+    
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(sort_time)
+def _compile_sort_time(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(sort_time, "sqlite")
+def _compile_sort_time_sqlite(element, compiler, **kw):
+    return "strftime('%%Y-%%m-%%d %%H:%%M:%%f', %s)" % compiler.process(element.clauses, **kw)
+
+
+class now_precise(FunctionElement):
+    """
+    The database's current time, with sub-second precision.
+    
+    Renders as now(), except on SQLite where CURRENT_TIMESTAMP has whole
+    seconds only. Use it for updated_at, which row ETags are built from,
+    so two writes in the same second give different versions.
+    """
+    
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(now_precise)
+def _compile_now_precise(element, compiler, **kw):
+    return compiler.process(func.now(), **kw)
+
+
+@compiles(now_precise, "sqlite")
+def _compile_now_precise_sqlite(element, compiler, **kw):
+    return "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session.
     
@@ -56,7 +281,172 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
         except Exception:
             await session.rollback()
+            for callback in session.info.get("after_rollback", ()):
+                try:
+                    await callback()
+                except Exception as e:
+                    # Never mask the error that caused the rollback
+                    logger.warning("Rollback cleanup failed: %s", e)
             raise
         finally:
             await session.close()
+    
+    for callback in session.info.get("after_commit", ()):
+        await callback()
+    
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        subject = token_subject(request.headers.get("Authorization"))
+        if subject is not None:
+            _recent_writers.set(subject, True)
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run an async callback once get_db has committed this session."""
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+def after_rollback(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run an async callback if get_db rolls this session back."""
+    session.info.setdefault("after_rollback", []).append(callback)
+
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a session for read-only handlers.
+    
+    The session runs in AUTOCOMMIT and is never committed, saving the
+    BEGIN/COMMIT round-trips of get_db. Reads go to the replica when one is
+    configured and healthy, and the caller has not written within
+    READ_YOUR_WRITES_SECONDS; otherwise they go to the primary.
+    """
+    session = await _open_read_session(request)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+@asynccontextmanager
+async def primary_read_session() -> AsyncIterator[AsyncSession]:
+    """
+    Short-lived AUTOCOMMIT read session on the primary.
+    
+    For reads that must not lag behind writes, such as loading the caller's
+    user row for authentication, without the BEGIN/COMMIT of get_db.
+    """
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def _open_read_session(request: Request) -> AsyncSession:
+    global _replica_down_until
+    
+    if ReplicaSessionLocal is None or time.monotonic() < _replica_down_until:
+        return ReadSessionLocal()
+    
+    subject = token_subject(request.headers.get("Authorization"))
+    if subject is not None and _recent_writers.get(subject):
+        return ReadSessionLocal()
+    
+    session = ReplicaSessionLocal()
+    session.info["replica"] = True
+    try:
+        # Check out a connection now (pre-ping included) so an unreachable
+        # replica falls back here rather than failing the handler's query
+        await session.connection()
+    except (DBAPIError, OSError, asyncio.TimeoutError):
+        await session.close()
+        _replica_down_until = time.monotonic() + settings.DATABASE_REPLICA_RETRY_SECONDS
+        return ReadSessionLocal()
+    
+    return session
+
+
+def reads_from_replica(session: AsyncSession) -> bool:
+    """True if a get_read_db session is reading from the replica."""
+    return session.info.get("replica", False)
+
+
+def open_stream_session() -> AsyncSession:
+    """
+    Open a read-only session for long streaming reads (exports).
+    
+    Unlike get_read_db this runs inside a transaction, which server-side
+    cursors require. It prefers a healthy replica and is never committed;
+    the caller must close it.
+    """
+    if ReplicaStreamSessionLocal is None or time.monotonic() < _replica_down_until:
+        return StreamSessionLocal()
+    return ReplicaStreamSessionLocal()
+
+
+async def warm_up_pool(connections: int = settings.DB_POOL_WARMUP) -> None:
+    """
+    Open pool connections up front so the first requests don't pay connect latency.
+    
+    Args:
+        connections: Number of connections to open (capped at DB_POOL_SIZE)
+    """
+    count = min(connections, settings.DB_POOL_SIZE)
+    if count <= 0:
+        return
+    
+    conns = await asyncio.gather(*(engine.connect() for _ in range(count)))
+    for conn in conns:
+        await conn.close()
+
+
+def pool_stats(target: AsyncEngine = engine) -> Dict[str, Any]:
+    """Return live pool usage and latency histograms for an engine."""
+    pool = target.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checkout_wait_seconds": pool.wait_time.snapshot(),
+        "connect_seconds": pool.connect_time.snapshot(),
+    }
+
+
+class RoundTripMiddleware:
+    """
+    ASGI middleware counting the database round trips of each request.
+    
+    Counts land in round_trip_stats under the endpoint that handled the
+    request. With DB_ROUND_TRIPS_HEADER on, the count so far is also sent
+    in the X-DB-Round-Trips response header; a streamed body's later
+    queries are recorded but miss the header.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        counter = [0]
+        token = _request_round_trips.set(counter)
+        
+        async def send_with_count(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.DB_ROUND_TRIPS_HEADER:
+                MutableHeaders(scope=message).append(ROUND_TRIPS_HEADER, str(counter[0]))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _request_round_trips.reset(token)
+            endpoint = scope.get("endpoint")
+            if endpoint is not None:
+                key = f"{endpoint.__module__.rsplit('.', 1)[-1]}.{endpoint.__name__}"
+                histogram = round_trip_stats.get(key)
+                if histogram is None:
+                    histogram = round_trip_stats[key] = Histogram(ROUND_TRIP_BUCKETS)
+                histogram.observe(counter[0])
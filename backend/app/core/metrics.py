@@ -0,0 +1,51 @@
+"""
+PATH: backend/app/core/metrics.py
+PURPOSE: Lightweight in-process metrics primitives
+ROLE IN ARCHITECTURE: Backing store for the admin metrics endpoints
+
+MAIN EXPORTS:
+    - Histogram: Fixed-bucket latency histogram
+
+NOTES FOR FUTURE AI:
+    - Metrics are per worker process; aggregate across workers externally
+"""
+
+import bisect
+from typing import Any, Dict, Sequence
+
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """
+    Non-cumulative histogram of observed values (seconds).
+    
+    Each observation is counted in the first bucket whose upper bound it
+    does not exceed; values above the last bound go to "+Inf".
+    """
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return bucket counts and summary values."""
+        labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "max": round(self.max, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "buckets": dict(zip(labels, self.counts)),
+        }
@@ -0,0 +1,210 @@
+"""
+PATH: backend/app/core/principal_cache.py
+PURPOSE: Cache of authenticated user rows keyed by user id
+ROLE IN ARCHITECTURE: Removes the per-request users SELECT from get_current_user
+
+MAIN EXPORTS:
+    - principal_cache: Process-wide PrincipalCache instance
+    - PrincipalCache: Two-tier (in-process + optional Redis) user cache
+
+NOTES FOR FUTURE AI:
+    - Call principal_cache.invalidate_on_commit(db, user_id) from any path
+      that changes a user's row, especially is_active or role; invalidating
+      before commit lets a concurrent miss re-cache the old row
+    - password_hash is never cached; cached instances carry
+      UNCACHED_PASSWORD_HASH instead, which is not a valid hash and so can
+      never verify a password
+    - With PRINCIPAL_CACHE_REDIS_ENABLED, invalidations are published on
+      INVALIDATION_CHANNEL and every worker's listen() task drops its local
+      copy. Pub/sub is at-most-once, so the local tier also expires after
+      PRINCIPAL_CACHE_LOCAL_TTL_SECONDS as a backstop
+    - Without Redis, other workers' local tiers are only cleared by TTL, so
+      multi-worker deployments should enable the Redis tier
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import after_commit
+from app.core.redis import get_redis
+from app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+CACHED_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "is_active",
+    "phone",
+    "created_at",
+    "updated_at",
+)
+REDIS_KEY_PREFIX = "principal:"
+INVALIDATION_CHANNEL = "principal:invalidate"
+
+# Stands in for password_hash on cached users, which are detached and so
+# cannot load the real column; "!" is not a valid hash for any scheme
+UNCACHED_PASSWORD_HASH = "!"
+
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    """Copy the cacheable columns of a loaded user."""
+    return {field: getattr(user, field) for field in CACHED_FIELDS}
+
+
+def _encode(snapshot: Dict[str, Any]) -> str:
+    data = dict(snapshot)
+    data["role"] = snapshot["role"].value
+    for field in ("created_at", "updated_at"):
+        if snapshot[field] is not None:
+            data[field] = snapshot[field].isoformat()
+    return json.dumps(data)
+
+
+def _decode(raw: str) -> Dict[str, Any]:
+    data = json.loads(raw)
+    data["role"] = UserRole(data["role"])
+    for field in ("created_at", "updated_at"):
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return data
+
+
+class PrincipalCache:
+    """
+    Cache of user rows used to authenticate requests.
+    
+    Lookups check the in-process LRU first, then Redis when
+    PRINCIPAL_CACHE_REDIS_ENABLED is set. Hits are returned as detached
+    instances, like users loaded by get_current_user on a miss.
+    """
+    
+    def __init__(self):
+        self.redis_enabled = settings.PRINCIPAL_CACHE_REDIS_ENABLED
+        local_ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS
+        if self.redis_enabled:
+            local_ttl = min(local_ttl, settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS)
+        self.local = TTLCache(
+            max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+            ttl_seconds=local_ttl,
+        )
+        self.redis_hits = 0
+        self.redis_misses = 0
+    
+    async def get(self, user_id: int) -> Optional[User]:
+        """
+        Return a detached user from cache, or None on a miss.
+        
+        Args:
+            user_id: User primary key
+        """
+        snapshot = self.local.get(user_id)
+        
+        if snapshot is None and self.redis_enabled:
+            snapshot = await self._redis_get(user_id)
+            if snapshot is not None:
+                self.local.set(user_id, snapshot)
+        
+        if snapshot is None:
+            return None
+        
+        user = User(**snapshot, password_hash=UNCACHED_PASSWORD_HASH)
+        make_transient_to_detached(user)
+        return user
+    
+    async def set(self, user: User) -> None:
+        """Cache a freshly loaded user."""
+        snapshot = _snapshot(user)
+        self.local.set(user.id, snapshot)
+        
+        if self.redis_enabled:
+            try:
+                await get_redis().set(
+                    f"{REDIS_KEY_PREFIX}{user.id}",
+                    _encode(snapshot),
+                    ex=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+                )
+            except RedisError as e:
+                logger.warning("Principal cache write to Redis failed: %s", e)
+    
+    async def invalidate(self, user_id: int) -> None:
+        """Drop a user from both tiers and from other workers' local tiers."""
+        self.local.delete(user_id)
+        
+        if self.redis_enabled:
+            try:
+                async with get_redis().pipeline(transaction=False) as pipe:
+                    pipe.delete(f"{REDIS_KEY_PREFIX}{user_id}")
+                    pipe.publish(INVALIDATION_CHANNEL, str(user_id))
+                    await pipe.execute()
+            except RedisError as e:
+                logger.warning("Principal cache invalidation in Redis failed: %s", e)
+    
+    async def listen(self) -> None:
+        """
+        Apply invalidations published by other workers until cancelled.
+        
+        Run as a background task when the Redis tier is enabled. The local
+        tier is cleared whenever the subscription (re)starts, since
+        invalidations sent while it was down are lost.
+        """
+        while True:
+            pubsub = get_redis().pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                self.local.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.local.delete(int(message["data"]))
+            except RedisError as e:
+                logger.warning("Principal cache invalidation listener failed: %s", e)
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(1)
+    
+    def invalidate_on_commit(self, db: AsyncSession, user_id: int) -> None:
+        """Drop a user once the request's get_db session has committed."""
+        async def _invalidate() -> None:
+            await self.invalidate(user_id)
+        
+        after_commit(db, _invalidate)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for both tiers."""
+        return {
+            "local": self.local.stats(),
+            "redis": {
+                "enabled": self.redis_enabled,
+                "hits": self.redis_hits,
+                "misses": self.redis_misses,
+            },
+        }
+    
+    async def _redis_get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await get_redis().get(f"{REDIS_KEY_PREFIX}{user_id}")
+        except RedisError as e:
+            logger.warning("Principal cache read from Redis failed: %s", e)
+            return None
+        
+        if raw is None:
+            self.redis_misses += 1
+            return None
+        
+        self.redis_hits += 1
+        return _decode(raw)
+
+
+principal_cache = PrincipalCache()
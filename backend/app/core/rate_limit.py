@@ -0,0 +1,109 @@
+"""
+PATH: backend/app/core/rate_limit.py
+PURPOSE: Sliding-window rate limiting
+ROLE IN ARCHITECTURE: Protects expensive endpoints (bcrypt, AI, uploads) from abuse
+
+MAIN EXPORTS:
+    - rate_limiter: Process-wide SlidingWindowLimiter instance
+    - SlidingWindowLimiter: Redis-backed limiter with an in-memory fallback
+
+NOTES FOR FUTURE AI:
+    - Use the RateLimit dependency in app.api.deps rather than calling this directly
+    - With RATE_LIMIT_REDIS_ENABLED unset (tests, single worker) limits are per process
+    - If Redis errors, the in-memory window is used for that check
+"""
+
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "ratelimit:"
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window log limiter.
+    
+    Each key may be hit at most `limit` times in any `window_seconds` span.
+    Rejected attempts are not recorded, so a blocked client regains access
+    as soon as its oldest accepted attempt leaves the window.
+    """
+    
+    def __init__(self):
+        self.redis_enabled = settings.RATE_LIMIT_REDIS_ENABLED
+        # Idle windows expire on their own; the bound caps memory under key floods
+        self._windows = TTLCache(
+            max_size=settings.RATE_LIMIT_MAX_KEYS,
+            ttl_seconds=3600,
+        )
+    
+    async def hit(self, key: str, limit: int, window_seconds: int) -> Optional[float]:
+        """
+        Record an attempt for `key` if it is within budget.
+        
+        Args:
+            key: Rate limit bucket, e.g. "login:ip:1.2.3.4"
+            limit: Maximum attempts per window
+            window_seconds: Window length
+        
+        Returns:
+            None if allowed, otherwise seconds until the next attempt is allowed
+        """
+        if self.redis_enabled:
+            try:
+                return await self._hit_redis(key, limit, window_seconds)
+            except RedisError as e:
+                logger.warning("Rate limit check in Redis failed, using memory: %s", e)
+        
+        return self._hit_memory(key, limit, window_seconds)
+    
+    def _hit_memory(self, key: str, limit: int, window_seconds: int) -> Optional[float]:
+        now = time.time()
+        window = self._windows.get(key)
+        if window is None:
+            window = deque()
+        
+        while window and window[0] <= now - window_seconds:
+            window.popleft()
+        
+        if len(window) >= limit:
+            self._windows.set(key, window, ttl=window_seconds)
+            return window[0] + window_seconds - now
+        
+        window.append(now)
+        self._windows.set(key, window, ttl=window_seconds)
+        return None
+    
+    async def _hit_redis(self, key: str, limit: int, window_seconds: int) -> Optional[float]:
+        now = time.time()
+        redis_key = f"{REDIS_KEY_PREFIX}{key}"
+        member = f"{now}:{uuid.uuid4().hex[:8]}"
+        
+        redis = get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(redis_key, 0, now - window_seconds)
+            pipe.zadd(redis_key, {member: now})
+            pipe.zcard(redis_key)
+            pipe.zrange(redis_key, 0, 0, withscores=True)
+            pipe.expire(redis_key, window_seconds)
+            _, _, count, oldest, _ = await pipe.execute()
+        
+        if count <= limit:
+            return None
+        
+        await redis.zrem(redis_key, member)
+        oldest_at = oldest[0][1] if oldest else now
+        return max(oldest_at + window_seconds - now, 0.0)
+
+
+rate_limiter = SlidingWindowLimiter()
@@ -0,0 +1,38 @@
+"""
+PATH: backend/app/core/redis.py
+PURPOSE: Shared Redis client
+ROLE IN ARCHITECTURE: Connection management for the optional shared cache tier
+
+MAIN EXPORTS:
+    - get_redis: Lazily created process-wide async Redis client
+    - close_redis: Close the client on shutdown
+
+NOTES FOR FUTURE AI:
+    - Redis is optional; callers must treat RedisError as a cache miss
+    - The client connects lazily on first command
+"""
+
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+
+_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Return the process-wide Redis client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the Redis client if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,239 @@
+"""
+PATH: backend/app/core/response_cache.py
+PURPOSE: Cache of rendered GET responses with tag-based invalidation
+ROLE IN ARCHITECTURE: Serves hot list endpoints without touching the database
+
+MAIN EXPORTS:
+    - response_cache: Process-wide ResponseCache instance
+    - ResponseCache: In-memory or Redis-backed cache with single-flight
+
+NOTES FOR FUTURE AI:
+    - Keys combine the route path, query string, a principal scope (see
+      app.api.deps.cache_scope) and the current version of every tag
+    - Invalidation bumps a tag's version, so all entries carrying it stop
+      matching at once; old entries simply age out
+    - Call response_cache.invalidate_on_commit(db, tag) from every write
+      handler that changes data served under that tag
+    - The build callable must not depend on request headers: one build
+      result is shared by concurrent identical requests and by later hits.
+      If-None-Match is applied here, after the cache
+    - build receives the session to query. Entries are always built on the
+      primary (a replica could be behind the tag version they are stored
+      under); uncached builds use the handler's own session
+    - Enabled by default only with RESPONSE_CACHE_REDIS_ENABLED. With the
+      memory backend entries and tag versions are per process, so other
+      workers can serve data up to the TTL old
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from fastapi import Request, Response
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.etags import if_none_match, not_modified
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import ReadSessionLocal, after_commit, reads_from_replica
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_ENTRY_PREFIX = "respcache:entry:"
+REDIS_TAG_PREFIX = "respcache:tag:"
+CACHED_HEADERS = ("content-type", "etag", "x-next-cursor")
+
+
+class ResponseCache:
+    """
+    Cache of successful GET responses.
+
+    Entries are stored in the in-process LRU, or in Redis when
+    RESPONSE_CACHE_REDIS_ENABLED is set. Concurrent misses for the same key
+    within a process wait for a single build (single-flight).
+    """
+
+    def __init__(self):
+        self.redis_enabled = settings.RESPONSE_CACHE_REDIS_ENABLED
+        self.enabled = (
+            settings.RESPONSE_CACHE_ENABLED
+            if settings.RESPONSE_CACHE_ENABLED is not None
+            else self.redis_enabled
+        )
+        self.ttl_seconds = settings.RESPONSE_CACHE_TTL_SECONDS
+        self.local = TTLCache(
+            max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+            ttl_seconds=self.ttl_seconds,
+        )
+        self.tag_versions: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    async def serve(
+        self,
+        request: Request,
+        db: AsyncSession,
+        scope: str,
+        tags: Sequence[str],
+        build: Callable[[AsyncSession], Awaitable[Response]],
+        ttl: Optional[int] = None,
+    ) -> Response:
+        """
+        Return a cached response for this request, building it on a miss.
+
+        Args:
+            request: Incoming GET request
+            db: The handler's get_read_db session
+            scope: Who the response is for (e.g. "staff" or "user:12")
+            tags: Tags to invalidate this entry by (e.g. ["projects"])
+            build: Produces the response from a session; only 200
+                responses are cached
+            ttl: Entry lifetime (default RESPONSE_CACHE_TTL_SECONDS)
+        """
+        if not self.enabled:
+            return self._conditional(request, await build(db))
+
+        key = self._key(request, scope, await self._versions(tags))
+        entry = await self._get(key)
+
+        if entry is not None:
+            self.hits += 1
+            return self._conditional(request, self._response(entry))
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            entry = await asyncio.shield(inflight)
+            if entry is not None:
+                return self._conditional(request, self._response(entry))
+            # The shared build failed or was not cacheable; build our own
+            return self._conditional(request, await build(db))
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        entry = None
+        try:
+            response = await self._build_on_primary(db, build)
+            entry = self._entry(response)
+            if entry is not None:
+                await self._set(key, entry, ttl or self.ttl_seconds)
+        finally:
+            future.set_result(entry)
+            del self._inflight[key]
+
+        return self._conditional(request, response)
+
+    async def _build_on_primary(
+        self,
+        db: AsyncSession,
+        build: Callable[[AsyncSession], Awaitable[Response]],
+    ) -> Response:
+        if not reads_from_replica(db):
+            return await build(db)
+        async with ReadSessionLocal() as primary:
+            return await build(primary)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every entry carrying any of `tags`."""
+        self.invalidations += 1
+        for tag in tags:
+            self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
+
+        if self.redis_enabled:
+            try:
+                async with get_redis().pipeline(transaction=False) as pipe:
+                    for tag in tags:
+                        pipe.incr(f"{REDIS_TAG_PREFIX}{tag}")
+                    await pipe.execute()
+            except RedisError as e:
+                logger.warning("Response cache invalidation in Redis failed: %s", e)
+
+    def invalidate_on_commit(self, db: AsyncSession, *tags: str) -> None:
+        """Invalidate `tags` once the request's get_db session has committed."""
+        async def _invalidate() -> None:
+            await self.invalidate(*tags)
+
+        after_commit(db, _invalidate)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "backend": "redis" if self.redis_enabled else "memory",
+            "entries": len(self.local),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
+
+    def _key(self, request: Request, scope: str, versions: List[int]) -> str:
+        raw = "|".join([
+            request.url.path,
+            "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items())),
+            scope,
+            ",".join(map(str, versions)),
+        ])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def _versions(self, tags: Sequence[str]) -> List[int]:
+        if self.redis_enabled:
+            try:
+                values = await get_redis().mget([f"{REDIS_TAG_PREFIX}{tag}" for tag in tags])
+                return [int(v or 0) for v in values]
+            except RedisError as e:
+                logger.warning("Response cache tag read from Redis failed: %s", e)
+        return [self.tag_versions.get(tag, 0) for tag in tags]
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.redis_enabled:
+            try:
+                raw = await get_redis().get(f"{REDIS_ENTRY_PREFIX}{key}")
+                return json.loads(raw) if raw is not None else None
+            except RedisError as e:
+                logger.warning("Response cache read from Redis failed: %s", e)
+        return self.local.get(key)
+
+    async def _set(self, key: str, entry: Dict[str, Any], ttl: int) -> None:
+        if self.redis_enabled:
+            try:
+                await get_redis().set(f"{REDIS_ENTRY_PREFIX}{key}", json.dumps(entry), ex=ttl)
+                return
+            except RedisError as e:
+                logger.warning("Response cache write to Redis failed: %s", e)
+        self.local.set(key, entry, ttl=ttl)
+
+    def _entry(self, response: Response) -> Optional[Dict[str, Any]]:
+        if response.status_code != 200 or not hasattr(response, "body"):
+            return None
+        headers = {
+            name: response.headers[name]
+            for name in CACHED_HEADERS
+            if name in response.headers
+        }
+        return {"body": response.body.decode(), "headers": headers}
+
+    def _response(self, entry: Dict[str, Any]) -> Response:
+        headers = dict(entry["headers"])
+        media_type = headers.pop("content-type", None)
+        return Response(content=entry["body"], headers=headers, media_type=media_type)
+
+    def _conditional(self, request: Request, response: Response) -> Response:
+        etag = response.headers.get("etag")
+        if etag and response.status_code == 200:
+            if if_none_match(request, etag):
+                return not_modified(etag)
+        return response
+
+
+response_cache = ResponseCache()
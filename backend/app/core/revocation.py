@@ -0,0 +1,125 @@
+"""
+PATH: backend/app/core/revocation.py
+PURPOSE: Revocation list for access tokens in stateless principal mode
+ROLE IN ARCHITECTURE: Lets claim-only authorization reject deactivated users
+
+MAIN EXPORTS:
+    - revocations: Process-wide RevocationSet instance
+    - RevocationSet: user_id -> revoked_at map synced from user_revocations
+
+NOTES FOR FUTURE AI:
+    - Call revocations.revoke(db, user_id) whenever is_active or role
+      changes; the row is written in the caller's transaction, so a failed
+      commit revokes nothing
+    - A revocation rejects tokens issued before it; new tokens still work.
+      Access tokens carry a sub-second `iat`, so ones issued right after a
+      revocation are not caught by it
+    - Every worker re-reads recent rows at most every
+      REVOCATION_SYNC_SECONDS, so revocations made on other workers apply
+      within that delay with or without Redis
+    - Entries older than the access token lifetime are pruned, since every
+      token they could reject has already expired
+"""
+
+import logging
+import time
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.writes import upsert_returning
+from app.core.config import settings
+from app.core.database import after_commit, primary_read_session
+from app.models.user import UserRevocation
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationSet:
+    """
+    Compact in-memory map of revoked user ids to revocation time.
+    
+    The map is refreshed from the user_revocations table at most every
+    REVOCATION_SYNC_SECONDS, so revocations made by other workers are
+    picked up without a per-request round-trip.
+    """
+    
+    def __init__(self):
+        self._revoked: Dict[int, float] = {}
+        self._last_sync = 0.0
+    
+    async def revoke(self, db: AsyncSession, user_id: int) -> None:
+        """
+        Reject all of a user's tokens issued up to now, once `db` commits.
+        
+        Args:
+            db: Session of the request changing the user
+            user_id: User whose tokens to revoke
+        """
+        if not settings.STATELESS_PRINCIPAL_ENABLED:
+            return
+        
+        revoked_at = time.time()
+        await upsert_returning(
+            db,
+            UserRevocation,
+            {"user_id": user_id, "revoked_at": revoked_at},
+            conflict_columns=["user_id"],
+            on_conflict_set={"revoked_at": revoked_at},
+        )
+        
+        async def _apply() -> None:
+            self._revoked[user_id] = max(revoked_at, self._revoked.get(user_id, 0.0))
+        
+        after_commit(db, _apply)
+    
+    async def is_revoked(self, user_id: int, issued_at: float) -> bool:
+        """
+        Check whether a token was issued before its user's revocation.
+        
+        Args:
+            user_id: Token subject
+            issued_at: Token `iat` claim (Unix seconds, possibly fractional)
+        """
+        if time.monotonic() - self._last_sync >= settings.REVOCATION_SYNC_SECONDS:
+            await self.sync()
+        
+        revoked_at = self._revoked.get(user_id)
+        return revoked_at is not None and issued_at < revoked_at
+    
+    async def sync(self) -> None:
+        """Merge recent revocations from the database and prune expired entries."""
+        self._last_sync = time.monotonic()
+        cutoff = time.time() - self._retention_seconds()
+        
+        try:
+            async with primary_read_session() as db:
+                result = await db.execute(
+                    select(UserRevocation.user_id, UserRevocation.revoked_at)
+                    .where(UserRevocation.revoked_at > cutoff)
+                )
+                rows = result.all()
+        except SQLAlchemyError as e:
+            logger.warning("Failed to sync revocations from the database: %s", e)
+            rows = []
+        
+        for user_id, revoked_at in rows:
+            self._revoked[user_id] = max(revoked_at, self._revoked.get(user_id, 0.0))
+        
+        self._revoked = {
+            user_id: revoked_at
+            for user_id, revoked_at in self._revoked.items()
+            if revoked_at > cutoff
+        }
+    
+    def __len__(self) -> int:
+        return len(self._revoked)
+    
+    @staticmethod
+    def _retention_seconds() -> int:
+        return settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+revocations = RevocationSet()
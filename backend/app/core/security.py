@@ -6,25 +6,61 @@ ROLE IN ARCHITECTURE: Security layer for JWT and password handling
 MAIN EXPORTS:
     - create_access_token: Generate JWT access token
     - create_refresh_token: Generate JWT refresh token
-    - verify_token: Validate and decode JWT
+    - verify_token: Validate and decode JWT (verified payloads are cached)
+    - token_subject: Subject of a valid bearer Authorization header
     - hash_password: Hash plaintext password
     - verify_password: Check password against hash
+    - hash_password_async: Hash on the bounded hashing pool
+    - verify_and_update_password_async: Verify on the pool, returning a rehash if needed
+    - PasswordHashingBusy: Raised when the hashing pool is saturated
 
 NOTES FOR FUTURE AI:
-    - Tokens use HS256 by default
-    - Password hashing uses bcrypt
+    - Tokens use HS256 by default; the signing key object is built once at import
+    - Verified payloads are cached by token digest until the token's own exp
+    - Password hashing uses bcrypt (cost from BCRYPT_ROUNDS)
+    - Request handlers must use the *_async helpers; bcrypt blocks for ~250ms
 """
 
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Any
-from jose import jwt, JWTError
+from typing import Optional, Any, Callable, Tuple
+from jose import jwk, jwt, JWTError
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 
+# Signing key, constructed once instead of on every encode/decode
+_jwt_key = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+
+# Payloads of tokens whose signature has already been verified
+_verified_tokens = TTLCache(
+    max_size=settings.JWT_VERIFY_CACHE_MAX_SIZE,
+    ttl_seconds=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt releases the GIL, so a small thread pool keeps it off the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_hash_pending = 0
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when too many hashing jobs are already queued."""
 
 
 def hash_password(password: str) -> str:
@@ -37,6 +73,47 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def _run_on_hash_pool(func: Callable, *args) -> Any:
+    """
+    Run a hashing function on the hashing pool with admission control.
+    
+    Raises:
+        PasswordHashingBusy: PASSWORD_HASH_MAX_PENDING jobs already queued or running
+    """
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHashingBusy()
+    
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a plaintext password without blocking the event loop."""
+    return await _run_on_hash_pool(pwd_context.hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password without blocking the event loop.
+    
+    Returns:
+        Tuple of (is_valid, new_hash). new_hash is set when the stored hash
+        uses outdated parameters (e.g. BCRYPT_ROUNDS changed) and should be
+        saved in place of the old one.
+    """
+    return await _run_on_hash_pool(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 def create_access_token(
     subject: str | Any,
     expires_delta: Optional[timedelta] = None,
@@ -62,6 +139,8 @@ def create_access_token(
     
     to_encode = {
         "exp": expire,
+        # Sub-second so a revocation in the same second is ordered correctly
+        "iat": time.time(),
         "sub": str(subject),
         "type": "access",
     }
@@ -71,7 +150,7 @@ def create_access_token(
     
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
+        _jwt_key,
         algorithm=settings.JWT_ALGORITHM,
     )
 
@@ -96,7 +175,7 @@ def create_refresh_token(subject: str | Any) -> str:
     
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
+        _jwt_key,
         algorithm=settings.JWT_ALGORITHM,
     )
 
@@ -105,6 +184,10 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
     """
     Verify and decode a JWT token.
     
+    Tokens that already passed signature verification are served from a
+    cache keyed by their SHA-256 digest until their `exp`. Tokens without
+    an `exp` claim are rejected.
+    
     Args:
         token: The JWT string to verify
         token_type: Expected token type ("access" or "refresh")
@@ -112,17 +195,46 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
     Returns:
         Decoded payload if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = _verified_tokens.get(digest)
+    
+    if payload is None or payload["exp"] <= time.time():
+        try:
+            payload = jwt.decode(
+                token,
+                _jwt_key,
+                algorithms=[settings.JWT_ALGORITHM],
+            )
+        except JWTError:
+            return None
         
-        if payload.get("type") != token_type:
+        if payload.get("exp") is None:
             return None
         
-        return payload
-    except JWTError:
+        _verified_tokens.set(digest, payload, ttl=payload["exp"] - time.time())
+    
+    if payload.get("type") != token_type:
         return None
+    
+    return dict(payload)
+
 
+def token_subject(authorization: Optional[str]) -> Optional[str]:
+    """
+    Return the subject of a valid access token in an Authorization header.
+    
+    Args:
+        authorization: Raw header value, e.g. "Bearer <jwt>"
+    
+    Returns:
+        The token's `sub` claim, or None if absent or invalid
+    """
+    if not authorization:
+        return None
+    
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    
+    payload = verify_token(token, token_type="access")
+    return payload.get("sub") if payload else None
@@ -9,15 +9,22 @@ MAIN EXPORTS:
 NOTES FOR FUTURE AI:
     - Add new routers in the include_router section
     - Middleware should be added before route registration
+    - Schema changes go in backend/alembic/versions, never in lifespan
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.api.v1.router import api_router
-from app.core.database import engine, Base
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.core.database import ROUND_TRIPS_HEADER, RoundTripMiddleware, engine, warm_up_pool
+from app.core.principal_cache import principal_cache
+from app.core.redis import close_redis
+from app.services.s3 import close_s3_client, get_s3_client
 
 
 @asynccontextmanager
@@ -27,18 +34,30 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup - Database connection is optional for initial deployment
-    # Tables will be created when database is configured
+    # Schema is managed by Alembic (`alembic upgrade head`), not at boot
     try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        await warm_up_pool()
     except Exception as e:
         print(f"Database not available: {e}. Continuing without database...")
+    # Build the shared S3 client once instead of on the first upload
+    get_s3_client()
+    # Apply principal invalidations made on other workers
+    invalidation_listener = None
+    if settings.PRINCIPAL_CACHE_REDIS_ENABLED:
+        invalidation_listener = asyncio.create_task(principal_cache.listen())
     yield
     # Shutdown
+    if invalidation_listener is not None:
+        invalidation_listener.cancel()
     try:
         await engine.dispose()
     except Exception:
         pass
+    try:
+        await close_redis()
+    except Exception:
+        pass
+    close_s3_client()
 
 
 app = FastAPI(
@@ -58,8 +77,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", ROUND_TRIPS_HEADER],
 )
 
+# Outermost, so the count covers everything the request does
+app.add_middleware(RoundTripMiddleware)
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
@@ -3,12 +3,12 @@ PATH: backend/app/models/__init__.py
 PURPOSE: SQLAlchemy model exports
 """
 
-from app.models.user import User
+from app.models.user import User, UserRevocation
 from app.models.client import Client
 from app.models.project import Project
-from app.models.document import Document
+from app.models.document import Document, DocumentBlob
 from app.models.task import Task
 from app.models.message import Message
 
-__all__ = ["User", "Client", "Project", "Document", "Task", "Message"]
+__all__ = ["User", "UserRevocation", "Client", "Project", "Document", "DocumentBlob", "Task", "Message"]
 
@@ -8,12 +8,12 @@ MAIN EXPORTS:
     - ClientStatus: Enum for client lifecycle status
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, now_precise, sort_time
 
 
 class ClientStatus(str, enum.Enum):
@@ -64,7 +64,14 @@ class Client(Base):
     health_score = Column(Integer, nullable=True)  # AI-generated 0-100
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=now_precise())
+    
+    __table_args__ = (
+        Index("ix_clients_user_id", user_id),
+        Index("ix_clients_abn", abn),
+        Index("ix_clients_created_at_id", sort_time(created_at).desc(), id.desc()),
+        Index("ix_clients_status_created_at_id", status, sort_time(created_at).desc(), id.desc()),
+    )
     
     # Relationships
     user = relationship("User", back_populates="client", foreign_keys=[user_id])
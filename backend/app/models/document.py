@@ -7,18 +7,20 @@ MAIN EXPORTS:
     - Document: SQLAlchemy model for documents
     - DocumentStatus: Enum for document status
     - DocumentCategory: Enum for document categories
+    - DocumentBlob: Content-addressed S3 object shared by identical documents
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, BigInteger
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, BigInteger, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, now_precise, sort_time
 
 
 class DocumentStatus(str, enum.Enum):
     """Document lifecycle status."""
+    PENDING_UPLOAD = "pending_upload"  # Direct upload requested, not yet completed
     UPLOADED = "uploaded"
     PENDING_SIGNATURE = "pending_signature"
     SIGNED = "signed"
@@ -53,6 +55,8 @@ class Document(Base):
         category: Document category
         status: Current status
         docusign_envelope_id: DocuSign envelope ID if sent for signing
+    
+    Documents with the same sha256_hash share one S3 object (see DocumentBlob).
     """
     __tablename__ = "documents"
     
@@ -65,7 +69,7 @@ class Document(Base):
     s3_key = Column(String(500), nullable=False)
     mime_type = Column(String(100), nullable=False)
     size_bytes = Column(BigInteger, nullable=False)
-    sha256_hash = Column(String(64), nullable=True)  # Deduplication
+    sha256_hash = Column(String(64), nullable=True)  # Deduplication (DocumentBlob)
     
     # Categorization
     category = Column(Enum(DocumentCategory), default=DocumentCategory.OTHER)
@@ -82,10 +86,37 @@ class Document(Base):
     parent_document_id = Column(Integer, ForeignKey("documents.id"), nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=now_precise())
+    
+    __table_args__ = (
+        Index("ix_documents_created_at_id", sort_time(created_at).desc(), id.desc()),
+        Index("ix_documents_project_id_created_at_id", project_id, sort_time(created_at).desc(), id.desc()),
+        Index("ix_documents_sha256_hash", sha256_hash),
+        Index("ix_documents_uploaded_by_id_status", uploaded_by_id, status),
+    )
     
     # Relationships
     project = relationship("Project", back_populates="documents")
     uploaded_by = relationship("User", foreign_keys=[uploaded_by_id])
     parent_document = relationship("Document", remote_side=[id])
 
+
+
+class DocumentBlob(Base):
+    """
+    One stored S3 object, shared by every document with the same content.
+    
+    Attributes:
+        sha256_hash: Hex SHA-256 of the content (primary key)
+        s3_key: AWS S3 object key
+        size_bytes: Object size
+        ref_count: Number of documents pointing at this object
+    """
+    __tablename__ = "document_blobs"
+    
+    sha256_hash = Column(String(64), primary_key=True)
+    s3_key = Column(String(500), nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=1)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -7,7 +7,7 @@ MAIN EXPORTS:
     - Message: SQLAlchemy model for messages
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -41,6 +41,10 @@ class Message(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    __table_args__ = (
+        Index("ix_messages_project_id_created_at", project_id, created_at.desc()),
+    )
+    
     # Relationships
     project = relationship("Project", back_populates="messages")
     sender = relationship("User", back_populates="sent_messages")
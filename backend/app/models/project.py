@@ -9,12 +9,12 @@ MAIN EXPORTS:
     - ProjectType: Enum for service types
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Date
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, now_precise, sort_time
 
 
 class ProjectStatus(str, enum.Enum):
@@ -79,7 +79,13 @@ class Project(Base):
     fixed_fee = Column(Integer, nullable=True)  # In cents
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=now_precise())
+    
+    __table_args__ = (
+        Index("ix_projects_created_at_id", sort_time(created_at).desc(), id.desc()),
+        Index("ix_projects_client_id_created_at_id", client_id, sort_time(created_at).desc(), id.desc()),
+        Index("ix_projects_status_created_at_id", status, sort_time(created_at).desc(), id.desc()),
+    )
     
     # Relationships
     client = relationship("Client", back_populates="projects")
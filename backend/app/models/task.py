@@ -9,12 +9,12 @@ MAIN EXPORTS:
     - TaskPriority: Enum for task priority
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Date
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, now_precise
 
 
 class TaskStatus(str, enum.Enum):
@@ -65,7 +65,11 @@ class Task(Base):
     actual_minutes = Column(Integer, nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=now_precise())
+    
+    __table_args__ = (
+        Index("ix_tasks_project_id_created_at", project_id, created_at.desc()),
+    )
     
     # Relationships
     project = relationship("Project", back_populates="tasks")
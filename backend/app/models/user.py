@@ -6,14 +6,15 @@ ROLE IN ARCHITECTURE: Core identity model
 MAIN EXPORTS:
     - User: SQLAlchemy model for users
     - UserRole: Enum for user roles
+    - UserRevocation: Cut-off time for a user's access tokens (stateless mode)
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, now_precise, sort_time
 
 
 class UserRole(str, enum.Enum):
@@ -50,7 +51,12 @@ class User(Base):
     phone = Column(String(20), nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=now_precise())
+    
+    __table_args__ = (
+        Index("ix_users_created_at_id", sort_time(created_at).desc(), id.desc()),
+        Index("ix_users_email_lower", func.lower(email)),
+    )
     
     # Relationships
     client = relationship(
@@ -72,3 +78,16 @@ class User(Base):
         """Return user's full name."""
         return f"{self.first_name} {self.last_name}"
 
+
+class UserRevocation(Base):
+    """
+    Access tokens of `user_id` issued before `revoked_at` are rejected.
+    
+    Written when a user's is_active or role changes; read by the
+    revocation set that backs stateless principal mode.
+    """
+    __tablename__ = "user_revocations"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    # Unix time; compared with the fractional `iat` of access tokens
+    revoked_at = Column(Float, nullable=False, index=True)
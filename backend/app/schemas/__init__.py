@@ -4,14 +4,28 @@ PURPOSE: Pydantic schema exports
 """
 
 from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserLogin, TokenResponse
-from app.schemas.client import ClientCreate, ClientUpdate, ClientResponse
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
-from app.schemas.document import DocumentCreate, DocumentResponse, DocumentUploadResponse
+from app.schemas.client import (
+    ClientCreate, ClientUpdate, ClientResponse, ClientBulkCreate, ClientBulkUpdate,
+    ImportJobResponse,
+)
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectBulkUpdate
+from app.schemas.task import TaskCreate, TaskBulkUpdate
+from app.schemas.document import (
+    DocumentCreate, DocumentResponse, DocumentUploadRequest, DocumentUploadResponse,
+    DocumentUploadComplete, DocumentDownloadUrlsRequest, DocumentDownloadUrlsResponse,
+    DocumentStorageReport,
+)
+from app.schemas.bulk import BulkItemResult, BulkResponse
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse", "UserLogin", "TokenResponse",
-    "ClientCreate", "ClientUpdate", "ClientResponse",
-    "ProjectCreate", "ProjectUpdate", "ProjectResponse",
-    "DocumentCreate", "DocumentResponse", "DocumentUploadResponse",
+    "ClientCreate", "ClientUpdate", "ClientResponse", "ClientBulkCreate", "ClientBulkUpdate",
+    "ImportJobResponse",
+    "ProjectCreate", "ProjectUpdate", "ProjectResponse", "ProjectBulkUpdate",
+    "TaskCreate", "TaskBulkUpdate",
+    "DocumentCreate", "DocumentResponse", "DocumentUploadRequest", "DocumentUploadResponse",
+    "DocumentUploadComplete", "DocumentDownloadUrlsRequest", "DocumentDownloadUrlsResponse",
+    "DocumentStorageReport",
+    "BulkItemResult", "BulkResponse",
 ]
 
@@ -0,0 +1,21 @@
+"""
+PATH: backend/app/schemas/bulk.py
+PURPOSE: Pydantic schemas for bulk create/update results
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one item in a bulk request."""
+    index: int
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    """Per-item results of a bulk request, in request order."""
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
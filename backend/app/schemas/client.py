@@ -4,7 +4,7 @@ PURPOSE: Pydantic schemas for client operations
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 
 from app.models.client import ClientStatus
@@ -29,6 +29,11 @@ class ClientCreate(ClientBase):
     pass
 
 
+class ClientBulkCreate(ClientCreate):
+    """Schema for one item of a bulk client creation (staff only)."""
+    user_id: int
+
+
 class ClientUpdate(BaseModel):
     """Schema for client updates."""
     company_name: Optional[str] = None
@@ -46,6 +51,11 @@ class ClientUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class ClientBulkUpdate(ClientUpdate):
+    """Schema for one item of a bulk client update."""
+    id: int
+
+
 class ClientResponse(ClientBase):
     """Schema for client responses."""
     id: int
@@ -60,3 +70,23 @@ class ClientResponse(ClientBase):
     class Config:
         from_attributes = True
 
+
+
+class ImportRowError(BaseModel):
+    """A rejected import row (line is None for file-level errors)."""
+    line: Optional[int]
+    error: str
+
+
+class ImportJobResponse(BaseModel):
+    """Progress of a client import job."""
+    id: str
+    filename: str
+    format: str
+    status: str
+    rows_read: int
+    imported: int
+    skipped: int
+    errors: List[ImportRowError]
+    started_at: datetime
+    finished_at: Optional[datetime]
@@ -4,8 +4,8 @@ PURPOSE: Pydantic schemas for document operations
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
 
 from app.models.document import DocumentStatus, DocumentCategory
 
@@ -38,13 +38,75 @@ class DocumentResponse(BaseModel):
         from_attributes = True
 
 
+class DocumentUploadRequest(BaseModel):
+    """Schema for requesting a direct-to-S3 upload."""
+    name: str
+    mime_type: str
+    size_bytes: int = Field(gt=0)
+    sha256: Optional[str] = Field(None, pattern="^[0-9a-fA-F]{64}$")
+    category: DocumentCategory = DocumentCategory.OTHER
+    description: Optional[str] = None
+    project_id: Optional[int] = None
+
+
 class DocumentUploadResponse(BaseModel):
-    """Schema for upload URL response."""
+    """
+    Schema for upload URL response.
+    
+    Small files: PUT the whole file to upload_url with upload_headers.
+    Large files: PUT each part_size slice to part_urls[n], then send the
+    returned ETags with upload_id to the complete endpoint.
+    """
+    document_id: int
+    upload_url: Optional[str] = None
+    upload_headers: Dict[str, str] = {}
+    upload_id: Optional[str] = None
+    part_size: Optional[int] = None
+    part_urls: List[str] = []
+    expires_in: int
+
+
+class UploadedPart(BaseModel):
+    """One uploaded part of a multipart upload."""
+    part_number: int = Field(ge=1)
+    etag: str
+
+
+class DocumentUploadComplete(BaseModel):
+    """Schema for finishing a direct-to-S3 upload."""
+    upload_id: Optional[str] = None
+    parts: List[UploadedPart] = []
+
+
+class DocumentDownloadUrlsRequest(BaseModel):
+    """Schema for requesting download URLs for several documents."""
+    document_ids: List[int]
+
+
+class DocumentDownloadUrl(BaseModel):
+    """Presigned download URL for one document."""
     document_id: int
-    upload_url: str
+    download_url: str
     expires_in: int
 
 
+class DocumentDownloadUrlsResponse(BaseModel):
+    """Schema for batch download URL responses."""
+    urls: List[DocumentDownloadUrl]
+    not_found: List[int]
+
+
+class DocumentStorageReport(BaseModel):
+    """Schema for the deduplicated storage report."""
+    blobs: int
+    references: int
+    stored_bytes: int
+    referenced_bytes: int
+    bytes_saved: int
+    unhashed_documents: int
+    unhashed_bytes: int
+
+
 class DocumentSignRequest(BaseModel):
     """Schema for DocuSign signing request."""
     signer_email: str
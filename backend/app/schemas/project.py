@@ -41,6 +41,11 @@ class ProjectUpdate(BaseModel):
     fixed_fee: Optional[int] = None
 
 
+class ProjectBulkUpdate(ProjectUpdate):
+    """Schema for one item of a bulk project update."""
+    id: int
+
+
 class ProjectResponse(ProjectBase):
     """Schema for project responses."""
     id: int
@@ -0,0 +1,38 @@
+"""
+PATH: backend/app/schemas/task.py
+PURPOSE: Pydantic schemas for task operations
+"""
+
+from datetime import date
+from typing import Optional
+from pydantic import BaseModel
+
+from app.models.task import TaskStatus, TaskPriority
+
+
+class TaskBase(BaseModel):
+    """Base task schema."""
+    title: str
+    description: Optional[str] = None
+    priority: TaskPriority = TaskPriority.MEDIUM
+    assignee_id: Optional[int] = None
+    due_date: Optional[date] = None
+    estimated_minutes: Optional[int] = None
+
+
+class TaskCreate(TaskBase):
+    """Schema for task creation."""
+    project_id: int
+
+
+class TaskBulkUpdate(BaseModel):
+    """Schema for one item of a bulk task update."""
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    assignee_id: Optional[int] = None
+    due_date: Optional[date] = None
+    estimated_minutes: Optional[int] = None
+    actual_minutes: Optional[int] = None
@@ -0,0 +1,396 @@
+"""
+PATH: backend/app/services/client_import.py
+PURPOSE: Streaming bulk import of clients from CSV or Parquet
+ROLE IN ARCHITECTURE: Onboarding path for firms migrating their client lists
+
+MAIN EXPORTS:
+    - ClientImporter: Validates and loads an import file chunk by chunk
+    - import_jobs: Process-wide ImportJobStore (job progress)
+    - run_import_file: Background task entry point for uploaded files
+    - validate_abn / validate_acn: Australian business number checksums
+
+NOTES FOR FUTURE AI:
+    - Files are read from disk in chunks of IMPORT_CHUNK_SIZE rows; parsing
+      runs in a worker thread so the event loop is not blocked
+    - Each chunk is committed on its own: one indexed ABN lookup, one email
+      lookup, then multi-row INSERT ... RETURNING for users and clients
+    - Emails are matched case-insensitively (on lower(email), which is
+      indexed) since existing accounts may have been stored mixed-case
+    - Every client needs a user row; rows whose email has no account get an
+      inactive CLIENT user with an unknown password (invite them later)
+    - Parquet needs pyarrow, which is optional
+    - Job progress is per process unless IMPORT_JOBS_REDIS_ENABLED is set
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+import re
+import secrets
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from redis.exceptions import RedisError
+from sqlalchemy import func, insert, select
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.redis import get_redis
+from app.core.response_cache import response_cache
+from app.core.security import hash_password_async
+from app.models.client import Client, ClientStatus
+from app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "import:job:"
+MAX_REPORTED_ERRORS = 100
+FORMATS = ("csv", "parquet")
+
+ABN_WEIGHTS = (10, 1, 3, 5, 7, 9, 11, 13, 15, 17, 19)
+ACN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 1)
+POSTCODE_AU = re.compile(r"^\d{4}$")
+
+CLIENT_COLUMNS = (
+    "company_name",
+    "abn",
+    "acn",
+    "industry",
+    "status",
+    "address_line1",
+    "address_line2",
+    "city",
+    "state",
+    "postcode",
+    "country",
+    "notes",
+)
+
+
+def _digits(value: str) -> str:
+    return re.sub(r"[\s-]", "", value)
+
+
+def validate_abn(abn: str) -> bool:
+    """Check an 11-digit ABN against the ATO checksum."""
+    if len(abn) != 11 or not abn.isdigit():
+        return False
+    digits = [int(d) for d in abn]
+    digits[0] -= 1
+    return sum(w * d for w, d in zip(ABN_WEIGHTS, digits)) % 89 == 0
+
+
+def validate_acn(acn: str) -> bool:
+    """Check a 9-digit ACN against the ASIC check digit."""
+    if len(acn) != 9 or not acn.isdigit():
+        return False
+    total = sum(w * int(d) for w, d in zip(ACN_WEIGHTS, acn))
+    return (10 - total % 10) % 10 == int(acn[8])
+
+
+def _clean(row: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Normalise header names and blank cells."""
+    cleaned = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        name = key.strip().lower().replace(" ", "_")
+        text = str(value).strip() if value is not None else ""
+        cleaned[name] = text or None
+    return cleaned
+
+
+def validate_row(row: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Validate one import row.
+
+    Returns:
+        (values, None) for a valid row, where values holds the client
+        columns plus email/first_name/last_name/phone for the user;
+        (None, reason) otherwise
+    """
+    row = _clean(row)
+
+    if not row.get("company_name"):
+        return None, "company_name is required"
+    if not row.get("email") or "@" not in row["email"]:
+        return None, "A valid email is required"
+
+    values: Dict[str, Any] = {column: row.get(column) for column in CLIENT_COLUMNS}
+    values["country"] = values["country"] or "Australia"
+
+    if values["abn"]:
+        values["abn"] = _digits(values["abn"])
+        if not validate_abn(values["abn"]):
+            return None, "Invalid ABN"
+    if values["acn"]:
+        values["acn"] = _digits(values["acn"])
+        if not validate_acn(values["acn"]):
+            return None, "Invalid ACN"
+
+    try:
+        values["status"] = ClientStatus((values["status"] or "lead").lower())
+    except ValueError:
+        return None, f"Invalid status: {values['status']}"
+
+    postcode = values["postcode"]
+    if postcode:
+        if values["country"].lower() == "australia" and not POSTCODE_AU.match(postcode):
+            return None, "Invalid postcode"
+        if len(postcode) > 10:
+            return None, "Invalid postcode"
+
+    values["email"] = row["email"].lower()
+    values["first_name"] = (row.get("first_name") or row["company_name"])[:100]
+    values["last_name"] = (row.get("last_name") or "")[:100]
+    values["phone"] = row.get("phone")
+    return values, None
+
+
+def _csv_chunks(path: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        chunk = []
+        for row in csv.DictReader(f):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _parquet_chunks(path: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet import requires pyarrow")
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield batch.to_pylist()
+
+
+def read_chunks(path: str, fmt: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the rows of an import file in lists of at most chunk_size."""
+    if fmt == "parquet":
+        return _parquet_chunks(path, chunk_size)
+    return _csv_chunks(path, chunk_size)
+
+
+class ImportJobStore:
+    """
+    Progress records for import jobs.
+
+    Kept in process memory, and mirrored to Redis when
+    IMPORT_JOBS_REDIS_ENABLED is set so any worker can report status.
+    """
+
+    def __init__(self):
+        self.local = TTLCache(max_size=1000, ttl_seconds=settings.IMPORT_JOB_TTL_SECONDS)
+        self.redis_enabled = settings.IMPORT_JOBS_REDIS_ENABLED
+
+    async def create(self, filename: str, fmt: str) -> Dict[str, Any]:
+        job = {
+            "id": uuid.uuid4().hex,
+            "filename": filename,
+            "format": fmt,
+            "status": "pending",
+            "rows_read": 0,
+            "imported": 0,
+            "skipped": 0,
+            "errors": [],
+            "started_at": time.time(),
+            "finished_at": None,
+        }
+        await self.save(job)
+        return job
+
+    async def save(self, job: Dict[str, Any]) -> None:
+        self.local.set(job["id"], job)
+
+        if self.redis_enabled:
+            try:
+                await get_redis().set(
+                    f"{REDIS_KEY_PREFIX}{job['id']}",
+                    json.dumps(job),
+                    ex=settings.IMPORT_JOB_TTL_SECONDS,
+                )
+            except RedisError as e:
+                logger.warning("Import job write to Redis failed: %s", e)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if self.redis_enabled:
+            try:
+                raw = await get_redis().get(f"{REDIS_KEY_PREFIX}{job_id}")
+                if raw is not None:
+                    return json.loads(raw)
+            except RedisError as e:
+                logger.warning("Import job read from Redis failed: %s", e)
+
+        return self.local.get(job_id)
+
+
+import_jobs = ImportJobStore()
+
+
+def detect_format(filename: Optional[str], fmt: Optional[str] = None) -> str:
+    """
+    Pick the import format from an explicit value or the file extension.
+
+    Raises:
+        ValueError: Unsupported format
+    """
+    fmt = (fmt or (filename or "").rsplit(".", 1)[-1]).lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported import format, expected one of {', '.join(FORMATS)}")
+    return fmt
+
+
+async def run_import_file(job: Dict[str, Any], path: str) -> None:
+    """Background task: import a spooled upload, then delete it."""
+    try:
+        await ClientImporter(job).run(path)
+    finally:
+        os.remove(path)
+
+
+class ClientImporter:
+    """
+    Load an import file into users and clients, chunk by chunk.
+
+    Rows are skipped (and reported) when they fail validation, repeat an
+    ABN seen earlier in the file or already stored, or name an email whose
+    user already has a client profile.
+    """
+
+    def __init__(self, job: Dict[str, Any], chunk_size: Optional[int] = None):
+        self.job = job
+        self.chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        self.seen_abns: Set[str] = set()
+        self.seen_emails: Set[str] = set()
+        self.password_hash: Optional[str] = None
+
+    async def run(self, path: str) -> Dict[str, Any]:
+        """Import every row of the file and return the final job record."""
+        self.job["status"] = "running"
+        await import_jobs.save(self.job)
+
+        # One unusable hash for all new accounts; users set a password on invite
+        self.password_hash = await hash_password_async(secrets.token_urlsafe(32))
+
+        chunks = read_chunks(path, self.job["format"], self.chunk_size)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                await self._load_chunk(chunk, first_line=self.job["rows_read"] + 2)
+                self.job["rows_read"] += len(chunk)
+                await import_jobs.save(self.job)
+        except Exception as e:
+            logger.exception("Client import %s failed", self.job["id"])
+            self.job["status"] = "failed"
+            self._error(None, str(e))
+        else:
+            self.job["status"] = "completed"
+        finally:
+            chunks.close()
+
+        self.job["finished_at"] = time.time()
+        await import_jobs.save(self.job)
+        return self.job
+
+    def _error(self, line: Optional[int], reason: str) -> None:
+        if len(self.job["errors"]) < MAX_REPORTED_ERRORS:
+            self.job["errors"].append({"line": line, "error": reason})
+
+    def _skip(self, line: int, reason: str) -> None:
+        self.job["skipped"] += 1
+        self._error(line, reason)
+
+    async def _load_chunk(self, chunk: List[Dict[str, Any]], first_line: int) -> None:
+        candidates: List[Tuple[int, Dict[str, Any]]] = []
+        for offset, raw in enumerate(chunk):
+            values, error = validate_row(raw)
+            if error:
+                self._skip(first_line + offset, error)
+            else:
+                candidates.append((first_line + offset, values))
+
+        if not candidates:
+            return
+
+        abns = {values["abn"] for _, values in candidates if values["abn"]}
+        emails = {values["email"] for _, values in candidates}
+
+        async with AsyncSessionLocal() as db:
+            stored_abns = set()
+            if abns:
+                result = await db.execute(select(Client.abn).where(Client.abn.in_(abns)))
+                stored_abns = set(result.scalars().all())
+
+            result = await db.execute(
+                select(func.lower(User.email), User.id, User.role, Client.id)
+                .outerjoin(Client, Client.user_id == User.id)
+                .where(func.lower(User.email).in_(emails))
+            )
+            accounts = {row[0]: row[1:] for row in result.all()}
+
+            rows: List[Dict[str, Any]] = []
+            for line, values in candidates:
+                abn, email = values["abn"], values["email"]
+                if abn and (abn in stored_abns or abn in self.seen_abns):
+                    self._skip(line, f"Duplicate ABN {abn}")
+                    continue
+                if email in self.seen_emails or (email in accounts and accounts[email][2]):
+                    self._skip(line, f"{email} already has a client profile")
+                    continue
+                if email in accounts and accounts[email][1] != UserRole.CLIENT:
+                    self._skip(line, f"{email} belongs to a staff account")
+                    continue
+                if abn:
+                    self.seen_abns.add(abn)
+                self.seen_emails.add(email)
+                rows.append(values)
+
+            new_users = [
+                {
+                    "email": values["email"],
+                    "password_hash": self.password_hash,
+                    "first_name": values["first_name"],
+                    "last_name": values["last_name"],
+                    "phone": values["phone"],
+                    "role": UserRole.CLIENT,
+                    "is_active": False,
+                }
+                for values in rows
+                if values["email"] not in accounts
+            ]
+            user_ids = {email: account[0] for email, account in accounts.items()}
+            if new_users:
+                result = await db.execute(
+                    insert(User).returning(User.email, User.id, sort_by_parameter_order=True),
+                    new_users,
+                )
+                user_ids.update(dict(result.all()))
+
+            if rows:
+                await db.execute(
+                    insert(Client),
+                    [
+                        {
+                            "user_id": user_ids[values["email"]],
+                            **{column: values[column] for column in CLIENT_COLUMNS},
+                        }
+                        for values in rows
+                    ],
+                )
+
+            await db.commit()
+
+        if rows:
+            await response_cache.invalidate("clients")
+        self.job["imported"] += len(rows)
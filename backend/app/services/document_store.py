@@ -0,0 +1,178 @@
+"""
+PATH: backend/app/services/document_store.py
+PURPOSE: Content-addressed document storage with reference counting
+ROLE IN ARCHITECTURE: Maps document content to shared S3 objects (DocumentBlob)
+
+MAIN EXPORTS:
+    - store_blob: Register an uploaded object, reusing an existing copy of the same content
+    - release_blob: Drop a document's reference, deleting the object with the last one
+    - storage_report: Stored vs. referenced bytes
+    - sweep_pending_uploads: Delete a user's abandoned direct uploads
+
+NOTES FOR FUTURE AI:
+    - Uploads are hashed while they stream, so a duplicate is only recognised
+      once uploaded; the fresh copy is then deleted after the transaction
+      commits (callers clean up fresh uploads themselves on rollback)
+    - ref_count only changes through single INSERT ... ON CONFLICT / UPDATE
+      statements, whose row locks serialize concurrent uploads and deletes of
+      the same content
+    - S3 objects of released blobs are deleted after the transaction commits
+    - Documents without sha256_hash (uploaded before deduplication) own
+      their object outright
+    - A PENDING_UPLOAD document owns its presigned key until it is completed;
+      no blob references it yet
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.writes import upsert_returning
+from app.core.config import settings
+from app.core.database import after_commit, sort_time
+from app.models.document import Document, DocumentBlob, DocumentStatus
+from app.services.s3 import S3Service, StoredObject
+
+
+async def store_blob(db: AsyncSession, s3_service: S3Service, stored: StoredObject) -> str:
+    """
+    Take a reference to the blob for an uploaded object's content.
+
+    Args:
+        db: Session of the request creating the document
+        s3_service: Service used to drop the upload, after commit, if it is a duplicate
+        stored: The freshly uploaded object
+
+    Returns:
+        S3 key the document should point at (an existing copy if there is one)
+    """
+    blob = await upsert_returning(
+        db,
+        DocumentBlob,
+        {
+            "sha256_hash": stored.sha256,
+            "s3_key": stored.key,
+            "size_bytes": stored.size_bytes,
+            "ref_count": 1,
+        },
+        conflict_columns=["sha256_hash"],
+        on_conflict_set={"ref_count": DocumentBlob.ref_count + 1},
+    )
+
+    if blob.s3_key != stored.key:
+        # Only drop the copy once the reference to the existing one is committed
+        async def _delete_duplicate() -> None:
+            await s3_service.delete_file(stored.key)
+
+        after_commit(db, _delete_duplicate)
+    return blob.s3_key
+
+
+async def release_blob(db: AsyncSession, s3_service: S3Service, document: Document) -> None:
+    """
+    Drop `document`'s reference to its stored objects.
+
+    The content object is deleted once no document references it; a signed
+    copy always belongs to the document alone.
+    """
+    keys: List[str] = []
+
+    remaining = None
+    if document.sha256_hash:
+        result = await db.execute(
+            update(DocumentBlob)
+            .where(
+                DocumentBlob.sha256_hash == document.sha256_hash,
+                DocumentBlob.s3_key == document.s3_key,
+            )
+            .values(ref_count=DocumentBlob.ref_count - 1)
+            .returning(DocumentBlob.ref_count)
+            .execution_options(synchronize_session=False)
+        )
+        remaining = result.scalar_one_or_none()
+
+    if remaining is None:
+        keys.append(document.s3_key)
+    elif remaining <= 0:
+        await db.execute(
+            delete(DocumentBlob)
+            .where(
+                DocumentBlob.sha256_hash == document.sha256_hash,
+                DocumentBlob.ref_count <= 0,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        keys.append(document.s3_key)
+
+    if document.signed_s3_key:
+        keys.append(document.signed_s3_key)
+
+    async def _delete_objects() -> None:
+        for key in keys:
+            await s3_service.delete_file(key)
+
+    if keys:
+        after_commit(db, _delete_objects)
+
+
+async def sweep_pending_uploads(db: AsyncSession, s3_service: S3Service, user_id: int) -> int:
+    """
+    Delete `user_id`'s direct uploads that were never completed.
+
+    Uploads pending for longer than S3_PENDING_UPLOAD_TTL_SECONDS are gone
+    for good: their presigned URLs have expired. Their objects (if any part
+    was uploaded) are deleted after the transaction commits.
+
+    Returns:
+        Number of pending documents deleted
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.S3_PENDING_UPLOAD_TTL_SECONDS)
+    result = await db.execute(
+        delete(Document)
+        .where(
+            Document.uploaded_by_id == user_id,
+            Document.status == DocumentStatus.PENDING_UPLOAD,
+            sort_time(Document.created_at)
+            < sort_time(bindparam(None, cutoff, type_=Document.created_at.type)),
+        )
+        .returning(Document.s3_key)
+        .execution_options(synchronize_session=False)
+    )
+    keys = result.scalars().all()
+
+    async def _delete_objects() -> None:
+        for key in keys:
+            await s3_service.delete_file(key)
+
+    if keys:
+        after_commit(db, _delete_objects)
+    return len(keys)
+
+
+async def storage_report(db: AsyncSession) -> Dict[str, Any]:
+    """Totals of stored and referenced bytes across all documents."""
+    blobs = (await db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(DocumentBlob.ref_count), 0),
+            func.coalesce(func.sum(DocumentBlob.size_bytes), 0),
+            func.coalesce(func.sum(DocumentBlob.size_bytes * DocumentBlob.ref_count), 0),
+        )
+    )).one()
+    unhashed = (await db.execute(
+        select(func.count(), func.coalesce(func.sum(Document.size_bytes), 0))
+        .where(Document.sha256_hash.is_(None))
+    )).one()
+
+    blob_count, references, stored_bytes, referenced_bytes = (int(v) for v in blobs)
+    return {
+        "blobs": blob_count,
+        "references": references,
+        "stored_bytes": stored_bytes,
+        "referenced_bytes": referenced_bytes,
+        "bytes_saved": referenced_bytes - stored_bytes,
+        "unhashed_documents": int(unhashed[0]),
+        "unhashed_bytes": int(unhashed[1]),
+    }
@@ -5,17 +5,144 @@ ROLE IN ARCHITECTURE: External storage integration
 
 MAIN EXPORTS:
     - S3Service: Service class for S3 operations
+    - get_s3_client: Process-wide boto3 client (created in lifespan)
+    - download_url_cache: Presigned GET URLs reused until shortly before expiry
+    - close_s3_client: Release the client and its executor on shutdown
+    - StoredObject: Key, size and SHA-256 of a streamed upload
+    - PresignedUpload: URLs a client uses to upload straight to S3
+    - ObjectStream: Chunk iterator over an object or byte range
+
+NOTES FOR FUTURE AI:
+    - upload_stream never holds more than S3_MULTIPART_MAX_IN_FLIGHT + 1
+      parts in memory, whatever the file size
+    - boto3 calls block, so every network call runs on a dedicated executor
+      of S3_MAX_WORKERS threads; the connection pool has one connection per
+      worker, so calls never wait for a connection
+    - Presigning is local HMAC work and stays on the event loop
+    - open_stream / iter_file read one S3_STREAM_CHUNK_SIZE chunk per pull,
+      so a slow consumer holds back the S3 read instead of buffering
+    - A cached download URL is handed to anyone authorized for the document;
+      callers must check access before calling presign_download
+    - Presigned PUTs carry the declared SHA-256 as a signed
+      x-amz-checksum-sha256 header, so S3 itself rejects other content
 """
 
+import asyncio
+import base64
+import hashlib
+import math
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from datetime import datetime
-from typing import Optional
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Protocol, Set, Tuple,
+)
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 
+class AsyncReadable(Protocol):
+    """Anything with an async read(size), e.g. fastapi.UploadFile."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+@dataclass
+class StoredObject:
+    """Result of S3Service.upload_stream."""
+    key: str
+    size_bytes: int
+    sha256: str
+
+
+@dataclass
+class PresignedUpload:
+    """Result of S3Service.create_presigned_upload."""
+    key: str
+    url: Optional[str] = None
+    headers: Optional[Dict[str, str]] = None
+    upload_id: Optional[str] = None
+    part_size: Optional[int] = None
+    part_urls: Optional[List[str]] = None
+
+
+@dataclass
+class ObjectStream:
+    """Result of S3Service.open_stream."""
+    content_length: int
+    content_range: Optional[str]
+    content_type: Optional[str]
+    chunks: AsyncIterator[bytes]
+
+
+# S3 limits a multipart upload to 10,000 parts
+MAX_PARTS = 10000
+
+_client: Optional[Any] = None
+_executor: Optional[ThreadPoolExecutor] = None
+
+# (key, expires_in) -> (url, expires_at); entries drop out
+# S3_URL_CACHE_MARGIN_SECONDS before the URL itself expires
+download_url_cache = TTLCache(
+    max_size=settings.S3_URL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.S3_DOWNLOAD_URL_EXPIRE_SECONDS,
+)
+
+
+def get_s3_client() -> Any:
+    """
+    Return the process-wide S3 client, creating it on first use.
+    
+    Building a client resolves credentials and endpoints (tens of ms), so
+    lifespan creates it at startup; boto3 clients are thread-safe.
+    """
+    global _client
+    if _client is None:
+        _client = boto3.client(
+            "s3",
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+            config=Config(
+                signature_version="s3v4",
+                max_pool_connections=settings.S3_MAX_WORKERS,
+                connect_timeout=settings.S3_CONNECT_TIMEOUT,
+                read_timeout=settings.S3_READ_TIMEOUT,
+                retries={"mode": "standard", "max_attempts": 3},
+                tcp_keepalive=True,
+            ),
+        )
+    return _client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.S3_MAX_WORKERS,
+            thread_name_prefix="s3",
+        )
+    return _executor
+
+
+def close_s3_client() -> None:
+    """Close the S3 client and its executor if they were created."""
+    global _client, _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
 class S3Service:
     """
     AWS S3 service for document upload/download.
@@ -27,14 +154,14 @@ class S3Service:
     """
     
     def __init__(self):
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION,
-        )
+        self.s3_client = get_s3_client()
         self.bucket_name = settings.AWS_S3_BUCKET
     
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking boto3 call on the S3 executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+    
     def _generate_key(self, filename: str) -> str:
         """Generate unique S3 key for file."""
         ext = filename.split(".")[-1] if "." in filename else ""
@@ -69,7 +196,8 @@ class S3Service:
             extra_args["ContentType"] = content_type
         
         try:
-            self.s3_client.put_object(
+            await self._run(
+                self.s3_client.put_object,
                 Bucket=self.bucket_name,
                 Key=key,
                 Body=content,
@@ -79,6 +207,254 @@ class S3Service:
         except ClientError as e:
             raise Exception(f"S3 upload failed: {e}")
     
+    async def upload_stream(
+        self,
+        stream: AsyncReadable,
+        filename: str,
+        content_type: Optional[str] = None,
+    ) -> StoredObject:
+        """
+        Upload a file to S3 in parts while hashing it.
+        
+        Files smaller than one part are sent with a single PUT; larger ones
+        use a multipart upload with at most S3_MULTIPART_MAX_IN_FLIGHT parts
+        uploading at once. A failed multipart upload is aborted.
+        
+        Args:
+            stream: Source to read from (e.g. an UploadFile)
+            filename: Original filename
+            content_type: MIME type
+        
+        Returns:
+            Object key, size in bytes and hex SHA-256 of the content
+        """
+        key = self._generate_key(filename)
+        part_size = max(settings.S3_MULTIPART_PART_SIZE, 5 * 1024 * 1024)
+        digest = hashlib.sha256()
+        size = 0
+        
+        async def read_part() -> bytes:
+            nonlocal size
+            buffer = bytearray()
+            while len(buffer) < part_size:
+                chunk = await stream.read(part_size - len(buffer))
+                if not chunk:
+                    break
+                buffer += chunk
+            part = bytes(buffer)
+            # Hash off the event loop; parts are read in order, so the
+            # digest covers the content in order
+            await asyncio.to_thread(digest.update, part)
+            size += len(part)
+            return part
+        
+        extra_args = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+        
+        part = await read_part()
+        try:
+            if len(part) < part_size:
+                await self._run(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=part,
+                    **extra_args,
+                )
+            else:
+                await self._upload_parts(key, part, read_part, extra_args)
+        except ClientError as e:
+            raise Exception(f"S3 upload failed: {e}")
+        
+        return StoredObject(key=key, size_bytes=size, sha256=digest.hexdigest())
+    
+    async def _upload_parts(
+        self,
+        key: str,
+        first_part: bytes,
+        read_part: Callable[[], Awaitable[bytes]],
+        extra_args: Dict[str, Any],
+    ) -> None:
+        """Multipart upload of `first_part` and the rest of read_part()."""
+        upload = await self._run(
+            self.s3_client.create_multipart_upload,
+            Bucket=self.bucket_name,
+            Key=key,
+            **extra_args,
+        )
+        upload_id = upload["UploadId"]
+        
+        async def send(number: int, body: bytes) -> Dict[str, Any]:
+            result = await self._run(
+                self.s3_client.upload_part,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )
+            return {"PartNumber": number, "ETag": result["ETag"]}
+        
+        in_flight: Set[asyncio.Task] = set()
+        parts: List[Dict[str, Any]] = []
+        try:
+            number, part = 1, first_part
+            while part:
+                if len(in_flight) >= settings.S3_MULTIPART_MAX_IN_FLIGHT:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    parts.extend(task.result() for task in done)
+                in_flight.add(asyncio.create_task(send(number, part)))
+                number += 1
+                part = await read_part()
+            
+            parts.extend(await asyncio.gather(*in_flight))
+            in_flight = set()
+            parts.sort(key=lambda p: p["PartNumber"])
+            await self._run(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            try:
+                await self._run(
+                    self.s3_client.abort_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            except ClientError:
+                # Left to the bucket's incomplete-upload lifecycle rule
+                pass
+            raise
+    
+    async def create_presigned_upload(
+        self,
+        filename: str,
+        content_type: str,
+        size_bytes: int,
+        sha256: Optional[str] = None,
+        expires_in: int = 3600,
+    ) -> PresignedUpload:
+        """
+        Presign a direct upload of a new object.
+        
+        Files up to one part get a single PUT URL; larger files get a
+        multipart upload and one PUT URL per part.
+        
+        Args:
+            filename: Original filename
+            content_type: MIME type the client must send
+            size_bytes: Declared file size
+            sha256: Declared hex SHA-256; enforced by S3 for single PUTs
+            expires_in: URL expiration in seconds
+        """
+        key = self._generate_key(filename)
+        part_size = max(
+            settings.S3_MULTIPART_PART_SIZE,
+            5 * 1024 * 1024,
+            math.ceil(size_bytes / MAX_PARTS),
+        )
+        
+        try:
+            if size_bytes <= part_size:
+                params = {"Bucket": self.bucket_name, "Key": key, "ContentType": content_type}
+                headers = {"Content-Type": content_type}
+                if sha256:
+                    checksum = base64.b64encode(bytes.fromhex(sha256)).decode()
+                    params["ChecksumSHA256"] = checksum
+                    headers["x-amz-checksum-sha256"] = checksum
+                url = self.s3_client.generate_presigned_url(
+                    "put_object",
+                    Params=params,
+                    ExpiresIn=expires_in,
+                )
+                return PresignedUpload(key=key, url=url, headers=headers)
+            
+            upload = await self._run(
+                self.s3_client.create_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=key,
+                ContentType=content_type,
+            )
+            part_urls = [
+                self.s3_client.generate_presigned_url(
+                    "upload_part",
+                    Params={
+                        "Bucket": self.bucket_name,
+                        "Key": key,
+                        "UploadId": upload["UploadId"],
+                        "PartNumber": number,
+                    },
+                    ExpiresIn=expires_in,
+                )
+                for number in range(1, math.ceil(size_bytes / part_size) + 1)
+            ]
+            return PresignedUpload(
+                key=key,
+                upload_id=upload["UploadId"],
+                part_size=part_size,
+                part_urls=part_urls,
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to presign upload: {e}")
+    
+    async def complete_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        parts: List[Dict[str, Any]],
+    ) -> bool:
+        """
+        Complete a client-driven multipart upload.
+        
+        Args:
+            key: S3 object key
+            upload_id: Multipart upload ID
+            parts: [{"PartNumber": n, "ETag": etag}, ...]
+        
+        Returns:
+            False if S3 rejected the upload ID or parts
+        """
+        try:
+            await self._run(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": sorted(parts, key=lambda p: p["PartNumber"])},
+            )
+            return True
+        except ClientError:
+            return False
+    
+    async def head_file(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch object metadata, including its stored SHA-256 checksum if any.
+        
+        Returns:
+            head_object response, or None if the object does not exist
+        """
+        try:
+            return await self._run(
+                self.s3_client.head_object,
+                Bucket=self.bucket_name,
+                Key=key,
+                ChecksumMode="ENABLED",
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise Exception(f"S3 head failed: {e}")
+    
     async def get_download_url(
         self,
         key: str,
@@ -94,15 +470,41 @@ class S3Service:
         Returns:
             Presigned URL string
         """
+        url, _ = self.presign_download(key, expires_in)
+        return url
+    
+    def presign_download(self, key: str, expires_in: Optional[int] = None) -> Tuple[str, int]:
+        """
+        Presigned download URL, reused from download_url_cache when possible.
+        
+        Args:
+            key: S3 object key
+            expires_in: URL lifetime (default S3_DOWNLOAD_URL_EXPIRE_SECONDS)
+        
+        Returns:
+            Tuple of (url, seconds until it expires)
+        """
+        expires_in = expires_in or settings.S3_DOWNLOAD_URL_EXPIRE_SECONDS
+        now = time.time()
+        
+        cached = download_url_cache.get((key, expires_in))
+        if cached is not None:
+            url, expires_at = cached
+            return url, int(expires_at - now)
+        
         try:
             url = self.s3_client.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": self.bucket_name, "Key": key},
                 ExpiresIn=expires_in,
             )
-            return url
         except ClientError as e:
             raise Exception(f"Failed to generate download URL: {e}")
+        
+        reuse_for = expires_in - settings.S3_URL_CACHE_MARGIN_SECONDS
+        if reuse_for > 0:
+            download_url_cache.set((key, expires_in), (url, now + expires_in), ttl=reuse_for)
+        return url, expires_in
     
     async def get_file(self, key: str) -> bytes:
         """
@@ -114,15 +516,82 @@ class S3Service:
         Returns:
             File content as bytes
         """
-        try:
+        def _download() -> bytes:
             response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
                 Key=key,
             )
             return response["Body"].read()
+        
+        try:
+            return await self._run(_download)
         except ClientError as e:
             raise Exception(f"S3 download failed: {e}")
     
+    async def open_stream(
+        self,
+        key: str,
+        first_byte: Optional[int] = None,
+        last_byte: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> ObjectStream:
+        """
+        Open an object (or a byte range of it) for chunked reading.
+        
+        Args:
+            key: S3 object key
+            first_byte: Start of the range (None for the whole object)
+            last_byte: Inclusive end of the range (None for end of object)
+            chunk_size: Bytes per chunk (default S3_STREAM_CHUNK_SIZE)
+        
+        Returns:
+            Object metadata and an async iterator over its content; iterate it
+            to the end (or close it) to release the connection
+        """
+        params = {"Bucket": self.bucket_name, "Key": key}
+        if first_byte is not None:
+            params["Range"] = f"bytes={first_byte}-{'' if last_byte is None else last_byte}"
+        
+        try:
+            response = await self._run(self.s3_client.get_object, **params)
+        except ClientError as e:
+            raise Exception(f"S3 download failed: {e}")
+        
+        body = response["Body"]
+        
+        async def chunks() -> AsyncIterator[bytes]:
+            iterator = body.iter_chunks(chunk_size or settings.S3_STREAM_CHUNK_SIZE)
+            try:
+                while True:
+                    chunk = await self._run(next, iterator, None)
+                    if chunk is None:
+                        break
+                    yield chunk
+            finally:
+                body.close()
+        
+        return ObjectStream(
+            content_length=response["ContentLength"],
+            content_range=response.get("ContentRange"),
+            content_type=response.get("ContentType"),
+            chunks=chunks(),
+        )
+    
+    async def iter_file(self, key: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Streaming variant of get_file.
+        
+        Args:
+            key: S3 object key
+            chunk_size: Bytes per chunk (default S3_STREAM_CHUNK_SIZE)
+        
+        Yields:
+            File content in chunks
+        """
+        stream = await self.open_stream(key, chunk_size=chunk_size)
+        async for chunk in stream.chunks:
+            yield chunk
+    
     async def delete_file(self, key: str) -> bool:
         """
         Delete file from S3.
@@ -134,7 +603,8 @@ class S3Service:
             True if successful
         """
         try:
-            self.s3_client.delete_object(
+            await self._run(
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=key,
             )
@@ -0,0 +1,50 @@
+"""
+Import clients from a CSV or Parquet file.
+
+Usage:
+    python import_clients.py clients.csv
+    python import_clients.py clients.parquet --chunk-size 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add the backend directory to sys.path so we can import 'app'
+sys.path.append(os.getcwd())
+
+from app.core.database import engine
+from app.services.client_import import ClientImporter, detect_format, import_jobs
+
+
+async def import_clients(path: str, fmt: str, chunk_size: int):
+    job = await import_jobs.create(os.path.basename(path), fmt)
+    importer = ClientImporter(job, chunk_size=chunk_size)
+
+    task = asyncio.create_task(importer.run(path))
+    while not task.done():
+        await asyncio.sleep(1)
+        print(f"read {job['rows_read']}, imported {job['imported']}, skipped {job['skipped']}")
+
+    job = task.result()
+    await engine.dispose()
+
+    for error in job["errors"]:
+        print(f"line {error['line']}: {error['error']}")
+    print(
+        f"Import {job['status']}: {job['imported']} imported, "
+        f"{job['skipped']} skipped of {job['rows_read']} rows."
+    )
+    return job["status"] == "completed"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import clients from CSV or Parquet")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "parquet"])
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args()
+
+    ok = asyncio.run(import_clients(args.path, detect_format(args.path, args.format), args.chunk_size))
+    sys.exit(0 if ok else 1)
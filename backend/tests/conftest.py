@@ -0,0 +1,122 @@
+"""
+PATH: backend/tests/conftest.py
+PURPOSE: Shared fixtures backed by a throwaway SQLite database
+
+NOTES FOR FUTURE AI:
+    - DATABASE_URL is pointed at a temporary SQLite file before the app is
+      imported, so the app's own engine, get_db and get_read_db are tested
+    - `statements` records every SQL statement sent while a test runs
+    - `query_plan` returns SQLite's EXPLAIN QUERY PLAN for index assertions
+"""
+
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/test.db"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["BCRYPT_ROUNDS"] = "4"
+
+from typing import Dict, List, Tuple  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.api import scoping  # noqa: E402
+from app.core.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.core.principal_cache import principal_cache  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def database():
+    """Create the schema for one test and drop it afterwards."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    principal_cache.local.clear()
+    scoping._client_ids.clear()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(database):
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def statements(database) -> List[str]:
+    """SQL statements sent to the database, in order."""
+    sent: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement)
+
+    event.listen(database.sync_engine, "before_cursor_execute", _record)
+    yield sent
+    event.remove(database.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def query_plan(database):
+    """SQLite's EXPLAIN QUERY PLAN details for a statement."""
+    async def _plan(stmt) -> List[str]:
+        sql = stmt.compile(dialect=database.dialect, compile_kwargs={"literal_binds": True})
+        async with database.connect() as conn:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+            return [row[-1] for row in result]
+
+    return _plan
+
+
+@pytest_asyncio.fixture
+async def client(database):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        yield http
+
+
+@pytest.fixture
+def add(db):
+    """Insert and commit one row of `model` built from keyword arguments."""
+    async def _add(model, **values):
+        row = model(**values)
+        db.add(row)
+        await db.commit()
+        return row
+
+    return _add
+
+
+@pytest.fixture
+def make_user(db):
+    """Factory for a committed user and the Authorization header to act as them."""
+    count = 0
+
+    async def _make(role: UserRole = UserRole.CLIENT) -> Tuple[User, Dict[str, str]]:
+        nonlocal count
+        count += 1
+        user = User(
+            email=f"user{count}@example.com",
+            password_hash="x",
+            first_name="Test",
+            last_name=f"User{count}",
+            role=role,
+        )
+        db.add(user)
+        await db.commit()
+        token = create_access_token(subject=user.id, extra_claims={"role": role.value})
+        return user, {"Authorization": f"Bearer {token}"}
+
+    return _make
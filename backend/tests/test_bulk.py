@@ -0,0 +1,49 @@
+"""
+PATH: backend/tests/test_bulk.py
+PURPOSE: Bulk creates report per-item results in request order
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.models.client import Client
+from app.models.project import Project
+from app.models.user import UserRole
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_with_partial_failures_keeps_order(db, client, statements, make_user, add):
+    _, headers = await make_user(UserRole.STAFF)
+    owner, _ = await make_user()
+    client_id = (await add(Client, user_id=owner.id, company_name="Acme")).id
+    missing_id = client_id + 1000
+
+    client_ids = [client_id, missing_id, client_id, client_id, missing_id, client_id]
+    items = [
+        {"client_id": cid, "name": f"Project {i}", "type": "other"}
+        for i, cid in enumerate(client_ids)
+    ]
+
+    # Warm the principal cache so only the handler's statements remain
+    await client.get("/api/v1/users/me", headers=headers)
+    statements.clear()
+    response = await client.post("/api/v1/projects/bulk", headers=headers, json=items)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (4, 2)
+    assert [r["index"] for r in body["results"]] == list(range(len(items)))
+    assert [r["error"] for r in body["results"]] == [
+        None if cid == client_id else "Client not found" for cid in client_ids
+    ]
+    # Client ids are checked in one query, not per item
+    assert len([s for s in statements if "FROM clients" in s]) == 1
+
+    # Each returned id belongs to the item at that index
+    names = dict((await db.execute(select(Project.id, Project.name))).all())
+    for i, result in enumerate(body["results"]):
+        if result["error"] is None:
+            assert names[result["id"]] == f"Project {i}"
+        else:
+            assert result["id"] is None
+    assert len(names) == 4
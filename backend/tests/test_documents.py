@@ -0,0 +1,121 @@
+"""
+PATH: backend/tests/test_documents.py
+PURPOSE: Direct uploads are scoped, hidden while pending and never left dangling
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.client import Client
+from app.models.document import Document, DocumentStatus
+from app.models.project import Project
+from app.services import s3 as s3_module
+
+moto = pytest.importorskip("moto")
+
+UPLOAD = {"name": "return.pdf", "mime_type": "application/pdf", "size_bytes": 6}
+
+
+@pytest_asyncio.fixture
+async def bucket(monkeypatch):
+    """A mocked S3 bucket; the app's client is rebuilt inside the mock."""
+    monkeypatch.setattr(settings, "AWS_REGION", "us-east-1")
+    with moto.mock_aws():
+        s3_module.close_s3_client()
+        client = s3_module.get_s3_client()
+        client.create_bucket(Bucket=settings.AWS_S3_BUCKET)
+        yield client
+        s3_module.close_s3_client()
+
+
+@pytest_asyncio.fixture
+async def owner(make_user, add):
+    """A client user's auth headers and the id of their one project."""
+    user, headers = await make_user()
+    client = await add(Client, user_id=user.id, company_name="Acme")
+    project = await add(Project, client_id=client.id, name="Audit")
+    return headers, project.id
+
+
+async def _document(db, document_id):
+    db.expire_all()
+    return await db.get(Document, document_id)
+
+
+@pytest.mark.asyncio
+async def test_upload_into_another_clients_project_is_404(db, client, bucket, owner, make_user):
+    _, project_id = owner
+    _, intruder = await make_user()
+
+    response = await client.post(
+        "/api/v1/documents/uploads", headers=intruder, json={**UPLOAD, "project_id": project_id}
+    )
+    assert response.status_code == 404
+    assert (await db.execute(select(Document.id))).first() is None
+
+    headers, _ = owner
+    response = await client.post(
+        "/api/v1/documents/uploads", headers=headers, json={**UPLOAD, "project_id": project_id}
+    )
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_pending_upload_is_not_readable(client, bucket, owner):
+    headers, project_id = owner
+    response = await client.post(
+        "/api/v1/documents/uploads", headers=headers, json={**UPLOAD, "project_id": project_id}
+    )
+    document_id = response.json()["document_id"]
+
+    for path in (f"/api/v1/documents/{document_id}", f"/api/v1/documents/{document_id}/download"):
+        assert (await client.get(path, headers=headers)).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_failed_verification_deletes_upload(db, client, bucket, owner):
+    headers, project_id = owner
+    response = await client.post(
+        "/api/v1/documents/uploads", headers=headers, json={**UPLOAD, "project_id": project_id}
+    )
+    document_id = response.json()["document_id"]
+    s3_key = (await _document(db, document_id)).s3_key
+    bucket.put_object(Bucket=settings.AWS_S3_BUCKET, Key=s3_key, Body=b"too long")
+
+    response = await client.post(f"/api/v1/documents/{document_id}/complete", headers=headers, json={})
+    assert response.status_code == 400
+
+    assert await _document(db, document_id) is None
+    assert bucket.list_objects_v2(Bucket=settings.AWS_S3_BUCKET)["KeyCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_not_yet_uploaded_stays_pending_until_swept(db, client, bucket, owner):
+    headers, project_id = owner
+    response = await client.post(
+        "/api/v1/documents/uploads", headers=headers, json={**UPLOAD, "project_id": project_id}
+    )
+    abandoned_id = response.json()["document_id"]
+
+    # Completing before the PUT has landed can be retried
+    response = await client.post(f"/api/v1/documents/{abandoned_id}/complete", headers=headers, json={})
+    assert response.status_code == 400
+    assert (await _document(db, abandoned_id)).status == DocumentStatus.PENDING_UPLOAD
+
+    document = await _document(db, abandoned_id)
+    abandoned_key = document.s3_key
+    age = timedelta(seconds=settings.S3_PENDING_UPLOAD_TTL_SECONDS + 60)
+    document.created_at = datetime.now(timezone.utc) - age
+    await db.commit()
+
+    response = await client.post(
+        "/api/v1/documents/uploads", headers=headers, json={**UPLOAD, "project_id": project_id}
+    )
+    assert response.status_code == 201
+    # SQLite may hand the swept row's id to the new one, so compare keys
+    keys = (await db.execute(select(Document.s3_key))).scalars().all()
+    assert len(keys) == 1 and keys[0] != abandoned_key
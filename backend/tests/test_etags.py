@@ -0,0 +1,42 @@
+"""
+PATH: backend/tests/test_etags.py
+PURPOSE: Conditional GETs see every write, even within the same second
+"""
+
+import pytest
+from sqlalchemy import update
+
+from app.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_me_etag_changes_after_patch_in_same_second(client, make_user):
+    _, headers = await make_user()
+
+    first = await client.get("/api/v1/users/me", headers=headers)
+    etag = first.headers["ETag"]
+    assert (await client.get("/api/v1/users/me", headers={**headers, "If-None-Match": etag})).status_code == 304
+
+    for name in ("Ada", "Grace"):
+        assert (await client.patch("/api/v1/users/me", headers=headers, json={"first_name": name})).status_code == 200
+
+        response = await client.get("/api/v1/users/me", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["first_name"] == name
+        assert response.headers["ETag"] != etag
+        etag = response.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_me_etag_ignores_cached_principal(db, client, make_user):
+    user, headers = await make_user()
+    user_id = user.id
+    etag = (await client.get("/api/v1/users/me", headers=headers)).headers["ETag"]
+
+    # A write that bypasses the endpoint leaves the cached principal stale
+    await db.execute(update(User).where(User.id == user_id).values(last_name="Lovelace"))
+    await db.commit()
+
+    response = await client.get("/api/v1/users/me", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["last_name"] == "Lovelace"
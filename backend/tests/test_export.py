@@ -0,0 +1,59 @@
+"""
+PATH: backend/tests/test_export.py
+PURPOSE: Exports stream EXPORT_BATCH_SIZE rows per chunk, header always first
+"""
+
+import csv
+import io
+
+import pytest
+
+from app.api.export import ExportParams
+from app.api.v1.endpoints.projects import export_projects
+from app.core.config import settings
+from app.models.client import Client
+from app.models.project import Project
+from app.models.user import UserRole
+
+
+async def _chunks(user, **params):
+    # httpx's ASGI transport joins the body, so read the response's own chunks
+    response = await export_projects(ExportParams(**params), None, None, user)
+    return [chunk async for chunk in response.body_iterator]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_one_chunk_per_batch(monkeypatch, make_user, add):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    staff, _ = await make_user(UserRole.STAFF)
+    owner, _ = await make_user()
+    client_row = await add(Client, user_id=owner.id, company_name="Acme")
+    for i in range(5):
+        await add(Project, client_id=client_row.id, name=f"Project {i}")
+
+    chunks = await _chunks(staff, format="csv", columns="id,name")
+
+    rows = [list(csv.reader(io.StringIO(chunk.decode()))) for chunk in chunks]
+    assert [len(r) for r in rows] == [3, 2, 1]
+    assert rows[0][0] == ["id", "name"]
+    # Newest first, across batch boundaries
+    names = [row[1] for r in rows for row in r if row != ["id", "name"]]
+    assert names == [f"Project {i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_empty_csv_export_still_has_header(make_user):
+    staff, _ = await make_user(UserRole.STAFF)
+
+    chunks = await _chunks(staff, format="csv", columns="id,name,status")
+
+    assert b"".join(chunks).decode().splitlines() == ["id,name,status"]
+
+
+@pytest.mark.asyncio
+async def test_empty_ndjson_export_is_empty(make_user):
+    staff, _ = await make_user(UserRole.STAFF)
+
+    chunks = await _chunks(staff, format="ndjson", columns=None)
+
+    assert b"".join(chunks) == b""
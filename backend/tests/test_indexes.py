@@ -0,0 +1,100 @@
+"""
+PATH: backend/tests/test_indexes.py
+PURPOSE: Hot list and lookup queries use the indexes the migrations create
+
+NOTES FOR FUTURE AI:
+    - The schema here is built by `alembic upgrade head`, not create_all,
+      so a migration that drops or misnames an index fails these tests
+"""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.pagination import PageParams
+from app.core.config import settings
+from app.models.client import Client, ClientStatus
+from app.models.document import Document
+from app.models.project import Project, ProjectStatus
+from app.models.user import User
+
+ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path, monkeypatch):
+    """A database migrated to head; overrides the create_all fixture."""
+    url = f"sqlite+aiosqlite:///{tmp_path}/migrated.db"
+    monkeypatch.setattr(settings, "DATABASE_URL", url)
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    # env.py drives the async engine with asyncio.run, so keep it off this loop
+    await asyncio.to_thread(command.upgrade, config, "head")
+
+    engine = create_async_engine(url)
+    yield engine
+    await engine.dispose()
+
+
+def _paged(query, model, cursor=True):
+    page = PageParams(limit=50, cursor=None)
+    if cursor:
+        page.after = (datetime(2026, 1, 1), 100)
+    return page.apply(query, model)
+
+
+LIST_QUERIES = [
+    ("ix_users_created_at_id", lambda: _paged(select(User), User)),
+    ("ix_clients_created_at_id", lambda: _paged(select(Client), Client)),
+    (
+        "ix_clients_status_created_at_id",
+        lambda: _paged(select(Client).where(Client.status == ClientStatus.ACTIVE), Client),
+    ),
+    ("ix_projects_created_at_id", lambda: _paged(select(Project), Project)),
+    (
+        "ix_projects_client_id_created_at_id",
+        lambda: _paged(select(Project).where(Project.client_id == 1), Project),
+    ),
+    (
+        "ix_projects_status_created_at_id",
+        lambda: _paged(select(Project).where(Project.status == ProjectStatus.IN_PROGRESS), Project),
+    ),
+    ("ix_documents_created_at_id", lambda: _paged(select(Document), Document)),
+    (
+        "ix_documents_project_id_created_at_id",
+        lambda: _paged(select(Document).where(Document.project_id == 1), Document, cursor=False),
+    ),
+]
+
+LOOKUP_QUERIES = [
+    ("ix_clients_user_id", lambda: select(Client).where(Client.user_id == 1)),
+    ("ix_clients_abn", lambda: select(Client.abn).where(Client.abn.in_(["51824753556"]))),
+    (
+        "ix_users_email_lower",
+        lambda: select(User.id).where(func.lower(User.email).in_(["a@example.com"])),
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("index, build", LIST_QUERIES, ids=[i for i, _ in LIST_QUERIES])
+async def test_list_query_reads_in_index_order(query_plan, index, build):
+    plan = await query_plan(build())
+
+    assert any(f"USING INDEX {index}" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("index, build", LOOKUP_QUERIES, ids=[i for i, _ in LOOKUP_QUERIES])
+async def test_lookup_query_searches_index(query_plan, index, build):
+    plan = await query_plan(build())
+
+    assert any(step.startswith("SEARCH") and index in step for step in plan), plan
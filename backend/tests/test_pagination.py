@@ -0,0 +1,76 @@
+"""
+PATH: backend/tests/test_pagination.py
+PURPOSE: Cursor pagination walks every row exactly once, on the paging index
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import Response
+from sqlalchemy import insert, select
+
+from app.api.pagination import NEXT_CURSOR_HEADER, PageParams, fetch_page
+from app.models.document import Document
+from app.models.user import User, UserRole
+
+
+def _user(i, **values):
+    return {
+        "email": f"u{i}@example.com",
+        "password_hash": "x",
+        "first_name": "F",
+        "last_name": "L",
+        "role": UserRole.CLIENT,
+        **values,
+    }
+
+
+async def _walk(db, limit):
+    """Follow X-Next-Cursor from the first page to the last."""
+    pages, cursor = [], None
+    while True:
+        response = Response()
+        rows = await fetch_page(db, select(User), User, PageParams(limit=limit, cursor=cursor), response)
+        pages.append([row.id for row in rows])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+async def test_two_page_walk_on_sqlite(db):
+    # Server-default timestamps (whole seconds, all equal) alongside ones
+    # written with microseconds
+    await db.execute(insert(User), [_user(i) for i in range(3)])
+    await db.execute(insert(User), [
+        _user(i, created_at=datetime(2020, 1, 1, 0, 0, 0, 500000)) for i in range(3, 6)
+    ])
+    await db.commit()
+
+    assert await _walk(db, limit=3) == [[3, 2, 1], [6, 5, 4]]
+
+
+@pytest.mark.asyncio
+async def test_cursor_boundary_inside_identical_timestamps(db):
+    same = datetime(2021, 6, 1, 12, 0, 0)
+    await db.execute(insert(User), [_user(i, created_at=same) for i in range(7)])
+    await db.commit()
+
+    # Every page boundary falls between rows with the same created_at
+    assert await _walk(db, limit=3) == [[7, 6, 5], [4, 3, 2], [1]]
+    assert await _walk(db, limit=1) == [[7], [6], [5], [4], [3], [2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_keyset_query_uses_created_at_id_index(query_plan):
+    page = PageParams(limit=50, cursor=None)
+    page.after = (datetime(2021, 6, 1, 12, 0, 0), 10)
+
+    plan = await query_plan(page.apply(select(User), User))
+    assert any("USING INDEX ix_users_created_at_id" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+    filtered = select(Document).where(Document.project_id == 1)
+    plan = await query_plan(page.apply(filtered, Document))
+    assert any("USING INDEX ix_documents_project_id_created_at_id" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
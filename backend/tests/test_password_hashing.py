@@ -0,0 +1,89 @@
+"""
+PATH: backend/tests/test_password_hashing.py
+PURPOSE: Password hashing is bounded and never blocks the event loop
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import PasswordHashingBusy, hash_password_async
+from app.models.user import User
+
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.mark.asyncio
+async def test_hashing_is_refused_at_the_pending_limit(monkeypatch, client):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 2)
+    release = threading.Event()
+
+    def slow_hash(password):
+        release.wait(5)
+        return "hashed"
+
+    monkeypatch.setattr(security.pwd_context, "hash", slow_hash)
+
+    running = [asyncio.create_task(hash_password_async(PASSWORD)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(PasswordHashingBusy):
+        await hash_password_async(PASSWORD)
+
+    body = {"email": "new@example.com", "password": PASSWORD, "first_name": "N", "last_name": "U"}
+    response = await client.post("/api/v1/auth/register", json=body)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+    release.set()
+    assert await asyncio.gather(*running) == ["hashed", "hashed"]
+
+    # Finished jobs free their slots
+    assert await hash_password_async(PASSWORD) == "hashed"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_logins_do_not_block_the_event_loop(db, client):
+    # A realistic cost, so each verification takes tens of milliseconds
+    slow_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=10)
+    password_hash = slow_context.hash(PASSWORD)
+    started = time.perf_counter()
+    slow_context.verify(PASSWORD, password_hash)
+    one_verify = time.perf_counter() - started
+
+    logins = settings.PASSWORD_HASH_WORKERS * 2
+    for i in range(logins):
+        db.add(User(
+            email=f"login{i}@example.com",
+            password_hash=password_hash,
+            first_name="L",
+            last_name=str(i),
+        ))
+    await db.commit()
+
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - before - 0.001)
+
+    tick = asyncio.create_task(ticker())
+    responses = await asyncio.gather(*[
+        client.post("/api/v1/auth/login", json={"email": f"login{i}@example.com", "password": PASSWORD})
+        for i in range(logins)
+    ])
+    done.set()
+    await tick
+
+    assert [r.status_code for r in responses] == [200] * logins
+    # Run on the event loop, the verifications would stall it for
+    # logins x one_verify; on the pool no stall lasts even one of them
+    assert max(lags) < one_verify, (max(lags), one_verify)
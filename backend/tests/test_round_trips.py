@@ -0,0 +1,50 @@
+"""
+PATH: backend/tests/test_round_trips.py
+PURPOSE: Each request's database round trips are counted as they happen
+"""
+
+import pytest
+
+from app.core.config import settings
+from app.core.database import ROUND_TRIPS_HEADER, round_trip_stats
+from app.models.client import Client
+from app.models.project import Project
+from app.models.user import UserRole
+
+
+@pytest.fixture
+def round_trip_header(monkeypatch):
+    monkeypatch.setattr(settings, "DB_ROUND_TRIPS_HEADER", True)
+    round_trip_stats.clear()
+
+
+@pytest.mark.asyncio
+async def test_round_trips_match_what_was_sent(round_trip_header, client, statements, make_user, add):
+    _, headers = await make_user(UserRole.ADMIN)
+    owner, _ = await make_user()
+    client_row = await add(Client, user_id=owner.id, company_name="Acme")
+    project = await add(Project, client_id=client_row.id, name="Audit")
+    project_id = project.id
+
+    # Load the principal and leave reusable connections in the pool
+    await client.get("/api/v1/users/me", headers=headers)
+
+    # The app engine pre-pings (DB_POOL_PRE_PING defaults to on)
+    assert settings.DB_POOL_PRE_PING
+
+    # An AUTOCOMMIT read: its statement plus the pre-ping on checkout
+    statements.clear()
+    response = await client.get(f"/api/v1/projects/{project_id}", headers=headers)
+    assert response.status_code == 200
+    assert int(response.headers[ROUND_TRIPS_HEADER]) == len(statements) + 1
+
+    # A get_db write: its statements, BEGIN, COMMIT and the pre-ping
+    statements.clear()
+    response = await client.patch(f"/api/v1/projects/{project_id}", headers=headers, json={"name": "Tax"})
+    assert response.status_code == 200
+    assert int(response.headers[ROUND_TRIPS_HEADER]) == len(statements) + 3
+
+    metrics = (await client.get("/api/v1/metrics/database", headers=headers)).json()["round_trips"]
+    assert metrics["projects.get_project"]["count"] == 1
+    assert metrics["projects.update_project"]["count"] == 1
+
@@ -0,0 +1,85 @@
+"""
+PATH: backend/tests/test_scoping.py
+PURPOSE: A client user's scoped reads are one statement, cached client id or not
+"""
+
+import pytest
+import pytest_asyncio
+
+from app.api import scoping
+from app.models.client import Client
+from app.models.document import Document
+from app.models.project import Project
+
+
+@pytest_asyncio.fixture
+async def tenants(make_user, add):
+    """Two client users, each with one project holding one document."""
+    rows = []
+    for name in ("Acme", "Globex"):
+        user, headers = await make_user()
+        client = await add(Client, user_id=user.id, company_name=name)
+        project = await add(Project, client_id=client.id, name=f"{name} audit")
+        document = await add(
+            Document,
+            project_id=project.id,
+            uploaded_by_id=user.id,
+            name=f"{name}.pdf",
+            s3_key=f"documents/{name}.pdf",
+            mime_type="application/pdf",
+            size_bytes=1,
+        )
+        rows.append((client, project, document, headers))
+    return rows
+
+
+async def _get(client, statements, path, headers):
+    # The first request of a user also loads the principal; keep that out
+    await client.get("/api/v1/users/me", headers=headers)
+    statements.clear()
+    response = await client.get(path, headers=headers)
+    return response, list(statements)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cached", [False, True])
+async def test_project_reads_are_one_statement(client, statements, tenants, cached):
+    (acme, acme_project, _, headers), (_, globex_project, _, _) = tenants
+    if cached:
+        scoping.remember_client_id(acme.user_id, acme.id)
+
+    response, sent = await _get(client, statements, "/api/v1/projects/", headers)
+    assert response.status_code == 200
+    assert [p["id"] for p in response.json()] == [acme_project.id]
+    assert len(sent) == 1
+    assert ("FROM clients" in sent[0]) is not cached
+
+    response, sent = await _get(client, statements, f"/api/v1/projects/{globex_project.id}", headers)
+    assert response.status_code == 403
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cached", [False, True])
+async def test_document_reads_are_one_statement(client, statements, tenants, cached):
+    (acme, _, acme_document, headers), (_, _, globex_document, _) = tenants
+    if cached:
+        scoping.remember_client_id(acme.user_id, acme.id)
+
+    response, sent = await _get(client, statements, "/api/v1/documents/", headers)
+    assert response.status_code == 200
+    assert [d["id"] for d in response.json()] == [acme_document.id]
+    assert len(sent) == 1
+    assert ("FROM clients" in sent[0]) is not cached
+
+    response, sent = await _get(client, statements, f"/api/v1/documents/{acme_document.id}", headers)
+    assert response.status_code == 200
+    assert len(sent) == 1
+
+    response, sent = await _get(client, statements, f"/api/v1/documents/{globex_document.id}", headers)
+    assert response.status_code == 404
+    assert len(sent) == 1
+
+    response, sent = await _get(client, statements, f"/api/v1/documents/{globex_document.id}/download", headers)
+    assert response.status_code == 404
+    assert len(sent) == 1
@@ -0,0 +1,78 @@
+"""
+PATH: backend/tests/test_writes.py
+PURPOSE: Creates and PATCHes are a single INSERT/UPDATE ... RETURNING
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.api.writes import insert_returning, update_returning
+from app.models.client import Client
+from app.models.project import Project
+from app.models.user import UserRole
+
+
+@pytest.mark.asyncio
+async def test_insert_returning_is_one_statement(db, statements, make_user, add):
+    user, _ = await make_user()
+    client = await add(Client, user_id=user.id, company_name="Acme")
+    statements.clear()
+
+    project = await insert_returning(db, Project, {"client_id": client.id, "name": "Audit"})
+
+    # Server defaults come back with the row; reading them sends nothing
+    assert project.id is not None and project.created_at is not None
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO projects")
+    assert "RETURNING" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_update_returning_is_one_statement(db, statements, make_user, add):
+    user, _ = await make_user()
+    client = await add(Client, user_id=user.id, company_name="Acme")
+    project = await insert_returning(db, Project, {"client_id": client.id, "name": "Audit"})
+    await db.commit()
+    statements.clear()
+
+    updated = await update_returning(db, Project, project.id, {"name": "Tax"}, not_found="Project not found")
+
+    assert updated.name == "Tax" and updated.updated_at is not None
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE projects")
+    assert "RETURNING" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_project_create_and_patch_write_once(db, client, statements, make_user, add):
+    staff, headers = await make_user(UserRole.STAFF)
+    owner, _ = await make_user()
+    client_row = await add(Client, user_id=owner.id, company_name="Acme")
+
+    # Warm the principal cache so only the handlers' own statements remain
+    assert (await client.get("/api/v1/users/me", headers=headers)).status_code == 200
+
+    statements.clear()
+    response = await client.post(
+        "/api/v1/projects/",
+        headers=headers,
+        json={"client_id": client_row.id, "name": "Audit", "type": "other"},
+    )
+    assert response.status_code == 201
+    project_statements = [s for s in statements if "projects" in s]
+    assert len(project_statements) == 1
+    assert project_statements[0].startswith("INSERT INTO projects")
+
+    statements.clear()
+    response = await client.patch(
+        f"/api/v1/projects/{response.json()['id']}",
+        headers=headers,
+        json={"name": "Tax"},
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Tax"
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE projects")
+
+    stored = (await db.execute(select(Project.name))).scalar_one()
+    assert stored == "Tax"